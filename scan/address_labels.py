@@ -207,6 +207,37 @@ def get_address_info(address):
         "chain": chain
     }
 
+def get_address_info_bulk(addresses):
+    """Get information for many addresses in a single pass"""
+    known = KNOWN_ADDRESSES
+    info_map = {}
+    for address in addresses:
+        hit = known.get(address.lower())
+        if hit is not None:
+            info_map[address] = hit
+        elif address.startswith('0x') and len(address) == 42:
+            info_map[address] = {
+                "label": f"{address[:10]}...",
+                "type": "unknown",
+                "exchange": "Unknown",
+                "chain": "ethereum"
+            }
+        elif len(address) > 30 and not address.startswith('0x'):
+            info_map[address] = {
+                "label": f"{address[:8]}...{address[-8:]}",
+                "type": "unknown",
+                "exchange": "Unknown",
+                "chain": "solana"
+            }
+        else:
+            info_map[address] = {
+                "label": f"{address.lower()[:10]}...",
+                "type": "unknown",
+                "exchange": "Unknown",
+                "chain": "ethereum"
+            }
+    return info_map
+
 def is_exchange_address(address):
     """Check if address belongs to a known exchange"""
     address = address.lower()
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import threading
 import requests
 from dataclasses import dataclass
 import logging
@@ -131,7 +132,10 @@ class FalsePositiveDetector:
 
 class MultiExchangeScanner:
     """Parallel scanning of multiple exchanges for whale detection"""
-    
+
+    # Scans within the same window are served from cache instead of re-scanned
+    SCAN_WINDOW_SECONDS = 300
+
     def __init__(self):
         self.exchanges = {
             'uniswap_v3': '0xE592427A0AEce92De3Edee1F18E0157C05861564',
@@ -140,7 +144,16 @@ class MultiExchangeScanner:
             'curve': '0x99a58482BD75cbab83b27EC03CA68fF489b5788f',
             'balancer': '0xBA12222222228d8Ba445958a75a0704d566BF2C8'
         }
-    
+        self._local = threading.local()
+        self._scan_cache = {}
+        self._scan_cache_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """Per-thread requests.Session so TCP/TLS connections are reused"""
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
     def scan_multiple_exchanges(self, exchange_names: List[str]) -> Dict:
         """
         Scan multiple exchanges in parallel
@@ -154,7 +167,7 @@ class MultiExchangeScanner:
         start_time = time.time()
         whales_found = 0
         
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        with ThreadPoolExecutor(max_workers=8) as executor:
             # Submit scanning tasks
             futures = []
             for exchange in exchange_names:
@@ -182,17 +195,29 @@ class MultiExchangeScanner:
         }
     
     def _scan_single_exchange(self, exchange_name: str) -> List[Dict]:
-        """Scan a single exchange for whale activity"""
+        """Scan a single exchange for whale activity
+
+        Results are memoized per (exchange, scan window) so repeated scans
+        within the same window are dict hits instead of new API calls.
+        """
+        window = int(time.time() // self.SCAN_WINDOW_SECONDS)
+        cache_key = (exchange_name, window)
+        with self._scan_cache_lock:
+            cached = self._scan_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Simulate whale detection for testing
-        # In production, this would make actual API calls
+        # In production, this would call the exchange subgraph through
+        # self._get_session() to reuse the thread's TCP/TLS connection
         import random
-        
+
         time.sleep(random.uniform(0.5, 2.0))  # Simulate API call time
-        
+
         # Generate mock whale data for testing
         whales = []
         whale_count = random.randint(2, 8)
-        
+
         for i in range(whale_count):
             whale = {
                 'address': f'0x{random.randint(100000000000000000000, 999999999999999999999):x}'[:42],
@@ -201,7 +226,9 @@ class MultiExchangeScanner:
                 'transactions': random.randint(5, 50)
             }
             whales.append(whale)
-        
+
+        with self._scan_cache_lock:
+            self._scan_cache[cache_key] = whales
         return whales
 
 class RealTimeWhaleDetector:
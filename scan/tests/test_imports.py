@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Import smoke tests
+Catch modules whose top-level statements fail (missing imports, typos)
+"""
+
+import unittest
+import sys
+import os
+import importlib
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class TestModuleImports(unittest.TestCase):
+    """Every listed module must import without raising"""
+
+    MODULES = [
+        'address_labels',
+        'database_analytics',
+        'validate_whale_addresses',
+        'whale_tracker_main',
+    ]
+
+    def test_modules_import_cleanly(self):
+        for name in self.MODULES:
+            with self.subTest(module=name):
+                importlib.import_module(name)
+
+if __name__ == '__main__':
+    unittest.main()
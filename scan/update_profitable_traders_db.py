@@ -8,6 +8,9 @@ import sqlite3
 from profitable_trader_analyzer import ProfitableTraderAnalyzer
 from datetime import datetime
 
+# Integer rank per tier so SQLite can sort by index instead of a CASE expression
+TIER_RANKS = {'ELITE': 1, 'ADVANCED': 2, 'PROFICIENT': 3, 'EMERGING': 4}
+
 def update_profitable_traders_database():
     """Update the profitable traders database with latest analysis"""
 
@@ -22,7 +25,12 @@ def update_profitable_traders_database():
     print(f"📊 Found {len(profitable_traders)} profitable traders to save")
 
     # Save to database
-    with sqlite3.connect("whale_tracker.db") as conn:
+    # Widened statement cache keeps the repeated INSERT plan prepared;
+    # larger page cache and mmap speed up the summary SELECTs at the end
+    with sqlite3.connect("whale_tracker.db", cached_statements=256) as conn:
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB mmap for reads
         cursor = conn.cursor()
 
         # Create profitable_traders table if it doesn't exist
@@ -35,12 +43,28 @@ def update_profitable_traders_database():
                 avg_profit_per_trade REAL,
                 profitability_score REAL,
                 tier TEXT,
+                tier_rank INTEGER,
                 trading_strategy TEXT,
                 last_analyzed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
 
+        # Add tier_rank for databases created before the column existed
+        try:
+            cursor.execute('ALTER TABLE profitable_traders ADD COLUMN tier_rank INTEGER')
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+
+        # Covering index for the summary/tier queries below and the web UI reads
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_pt_tier
+            ON profitable_traders(tier, profitability_score DESC)
+        ''')
+        # Drop the tier_rank index if an earlier version created it: the
+        # fused summary query made it unread
+        cursor.execute('DROP INDEX IF EXISTS idx_pt_tier_rank')
+
         # Insert or update each profitable trader
         traders_saved = 0
         for trader in profitable_traders:
@@ -48,8 +72,8 @@ def update_profitable_traders_database():
                 cursor.execute('''
                     INSERT OR REPLACE INTO profitable_traders
                     (wallet_address, total_profit, win_rate, trade_count, avg_profit_per_trade,
-                     profitability_score, tier, trading_strategy, last_analyzed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     profitability_score, tier, tier_rank, trading_strategy, last_analyzed)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
                     trader['wallet_address'],
                     trader['metrics']['total_profit'],
@@ -58,6 +82,7 @@ def update_profitable_traders_database():
                     trader['metrics']['avg_profit_per_trade'],
                     trader['profitability_score'],
                     trader['tier'],
+                    TIER_RANKS.get(trader['tier'], len(TIER_RANKS)),
                     trader['pattern']['primary_strategy'],
                     datetime.now()
                 ))
@@ -71,14 +96,20 @@ def update_profitable_traders_database():
         conn.commit()
         print(f"\n💾 Successfully saved {traders_saved} profitable traders to database")
 
-        # Display summary statistics
+        # Display summary statistics and tier distribution from one
+        # table scan: conditional aggregates replace the separate
+        # GROUP BY tier round trip
         cursor.execute('''
             SELECT
                 COUNT(*) as total_traders,
                 AVG(profitability_score) as avg_score,
                 SUM(total_profit) as total_profits,
                 AVG(win_rate) as avg_win_rate,
-                MAX(profitability_score) as highest_score
+                MAX(profitability_score) as highest_score,
+                SUM(tier = 'ELITE') as elite_count,
+                SUM(tier = 'ADVANCED') as advanced_count,
+                SUM(tier = 'PROFICIENT') as proficient_count,
+                SUM(tier = 'EMERGING') as emerging_count
             FROM profitable_traders
         ''')
 
@@ -90,23 +121,12 @@ def update_profitable_traders_database():
         print(f"   Average Win Rate: {stats[3]:.1%}")
         print(f"   Highest Score: {stats[4]:.1f}")
 
-        # Show tier distribution
-        cursor.execute('''
-            SELECT tier, COUNT(*) as count
-            FROM profitable_traders
-            GROUP BY tier
-            ORDER BY
-                CASE tier
-                    WHEN 'ELITE' THEN 1
-                    WHEN 'ADVANCED' THEN 2
-                    WHEN 'PROFICIENT' THEN 3
-                    WHEN 'EMERGING' THEN 4
-                END
-        ''')
-
         print(f"\n🏆 Tier Distribution:")
-        for tier, count in cursor.fetchall():
+        for tier, count in zip(TIER_RANKS, stats[5:9]):
             print(f"   {tier}: {count} traders")
 
+        # Refresh planner statistics so the web UI benefits from the new indexes
+        cursor.execute('ANALYZE profitable_traders')
+
 if __name__ == '__main__':
     update_profitable_traders_database()
\ No newline at end of file
